@@ -1,13 +1,25 @@
 from __future__ import annotations
 import json
+import os
 import re
+import threading
+
+# Board files carry long history arrays; orjson decodes them several times
+# faster than stdlib json. Same fallback pattern as the scrape services.
+try:
+    import orjson as _json
+    _json_loads = _json.loads
+except Exception:
+    _json_loads = json.loads
 import unicodedata
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Literal, List, Dict
 
+import numpy as np
 from cachetools.func import ttl_cache
-from pydantic import BaseModel, AnyUrl, Field, ValidationError, model_validator
+from pydantic import BaseModel, AnyUrl, Field, PrivateAttr, ValidationError, model_validator
 
 
 # ---------- time helpers ----------
@@ -67,18 +79,42 @@ class Job(BaseModel):
     link: str
     history: List[Status] = Field(default_factory=list)
 
+    # Cached integer view of history for vectorized consumers; rebuilt
+    # lazily after mark() mutates the list.
+    _history_ns: Optional[np.ndarray] = PrivateAttr(default=None)
+    _history_active: Optional[np.ndarray] = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def _normalize(self) -> "Job":
         self.history = _normalize_history(self.history)
         return self
 
+    def history_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        History as two aligned arrays: event times (int64 UTC nanoseconds)
+        and active flags. The normalizing validator keeps history sorted, so
+        the arrays are ascending — downstream passes compare plain int64
+        instead of re-sorting and comparing datetimes per call.
+        """
+        if self._history_ns is None:
+            ns = np.empty(len(self.history), dtype=np.int64)
+            active = np.empty(len(self.history), dtype=bool)
+            for i, ev in enumerate(self.history):
+                ts = ev.at if ev.at.tzinfo else ev.at.replace(tzinfo=timezone.utc)
+                ns[i] = int(ts.timestamp() * 1_000_000_000)
+                active[i] = ev.status == "active"
+            self._history_ns = ns
+            self._history_active = active
+        return self._history_ns, self._history_active
+
     def is_active(self) -> bool:
         return bool(self.history) and self.history[-1].status == "active"
 
-    def age(self) -> timedelta:
+    def age(self, now: Optional[datetime] = None) -> timedelta:
         """
         Time since this job was first observed active (i.e., first scrape event).
-        Returns timedelta(0) if no history.
+        Returns timedelta(0) if no history. Callers iterating many jobs can
+        pass one shared `now` instead of paying a clock read per job.
         """
         if not self.history:
             return timedelta(0)
@@ -91,14 +127,14 @@ class Job(BaseModel):
                 break
         anchor = first_active_at if first_active_at is not None else self.history[0].at
 
-        dt = now_utc() - anchor
+        dt = (now or now_utc()) - anchor
         return dt if dt.total_seconds() > 0 else timedelta(0)
 
-    def is_new(self, threshold: timedelta = timedelta(hours=24)) -> bool:
+    def is_new(self, threshold: timedelta = timedelta(hours=24), now: Optional[datetime] = None) -> bool:
         """
         New if age <= threshold (default 24h).
         """
-        return self.age() <= threshold
+        return self.age(now) <= threshold
 
     def mark(self, new_status: Literal["active", "inactive"], at: Optional[datetime] = None) -> None:
         """
@@ -111,6 +147,8 @@ class Job(BaseModel):
         self.history.append(Status(status=new_status, at=ts))
         # Keep tidy immediately
         self.history = _normalize_history(self.history)
+        self._history_ns = None
+        self._history_active = None
 
 
 # ---------- scrape health & attempts ----------
@@ -184,17 +222,28 @@ class JobBoard(BaseModel):
     # Data
     content: List[Job] = Field(default_factory=list)
 
+    # Flattened history events for intervals_array(); rebuilt lazily per
+    # instance, so boards reused by load_pages_cached pay the Python-level
+    # flattening once instead of per dashboard refresh.
+    _events_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = PrivateAttr(default=None)
+
     # --- File IO ---
     @classmethod
     @ttl_cache(ttl=30)
     def from_file(cls, path: Path) -> "JobBoard":
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = _json_loads(path.read_bytes())
         return cls(**data)
 
     def to_file(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        text = self.model_dump_json(indent=2)
-        path.write_text(text, encoding="utf-8")
+        data = self.model_dump_json(indent=2).encode("utf-8")
+        # Write to a sibling tempfile and rename: the rename is atomic, so
+        # concurrent readers (UI fragments, the mtime cache) never observe a
+        # partially written JSON.
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "wb", buffering=1 << 16) as f:
+            f.write(data)
+        os.replace(tmp, path)
 
     # --- Health & attempts ---
     def record_attempt(
@@ -309,6 +358,62 @@ class JobBoard(BaseModel):
             "last_success_count": h.last_success_count,
         }
 
+    # --- Vectorized activity view ---
+    def intervals_array(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All active intervals across this board's jobs as three aligned arrays:
+        starts and ends (datetime64[ns], UTC) plus the owning job's index in
+        `content`. Open intervals are closed at call time.
+
+        History is already normalized per job (sorted ascending, alternating
+        statuses), so each 'active' event starts an interval that the next
+        event of the same job — or "now" — ends. That makes the whole
+        computation a handful of array ops instead of a Python loop per job.
+        """
+        cached = self._events_cache
+        if cached is None:
+            per_at: List[np.ndarray] = []
+            per_active: List[np.ndarray] = []
+            per_id: List[np.ndarray] = []
+            for idx, job in enumerate(self.content):
+                ns, active = job.history_arrays()
+                if ns.size:
+                    per_at.append(ns)
+                    per_active.append(active)
+                    per_id.append(np.full(ns.size, idx, dtype=np.int32))
+            if per_at:
+                cached = (
+                    np.concatenate(per_at),
+                    np.concatenate(per_active),
+                    np.concatenate(per_id),
+                )
+            else:
+                cached = (
+                    np.empty(0, dtype=np.int64),
+                    np.empty(0, dtype=bool),
+                    np.empty(0, dtype=np.int32),
+                )
+            self._events_cache = cached
+
+        at, is_active, jid = cached
+        if at.size == 0:
+            empty = np.empty(0, dtype="datetime64[ns]")
+            return empty, empty.copy(), np.empty(0, dtype=np.int32)
+
+        now_ns = int(now_utc().timestamp() * 1_000_000_000)
+        next_at = np.empty_like(at)
+        next_at[:-1] = at[1:]
+        next_at[-1] = now_ns
+        same_job = np.empty_like(is_active)
+        same_job[:-1] = jid[1:] == jid[:-1]
+        same_job[-1] = False
+        end_at = np.where(same_job, next_at, now_ns)
+
+        keep = is_active & (end_at > at)
+        starts = at[keep].view("datetime64[ns]")
+        ends = end_at[keep].view("datetime64[ns]")
+        return starts, ends, jid[keep]
+
     # --- Health-aware merge ---
     def apply_scrape(
         self,
@@ -392,8 +497,12 @@ class JobBoard(BaseModel):
         # Sort active first, then title
         self.content.sort(key=lambda j: (0 if j.is_active() else 1, j.title.lower()))
 
+        # Histories changed; the flattened event view must be rebuilt.
+        self._events_cache = None
+
 
 # ---------- utilities (unchanged) ----------
+@lru_cache(maxsize=1024)
 def slugify(value: str) -> str:
     value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
     value = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-").lower()
@@ -414,3 +523,61 @@ def load_pages(pages_dir: Path) -> list[Tuple[Path, JobBoard]]:
             # Skip invalid JSONs; you could log these if you want.
             continue
     return out
+
+
+# Parsed boards keyed by RESOLVED path, so callers addressing the same
+# directory through different spellings (relative vs absolute) share one set
+# of entries instead of evicting each other's. The (st_mtime_ns, st_size)
+# pair detects edits; entries for files that vanished from the scanned
+# directory are dropped on each scan. The lock matters because the scrape
+# worker thread and Streamlit's script threads hit this concurrently.
+_PAGES_CACHE: Dict[Path, Tuple[int, int, JobBoard]] = {}
+_PAGES_CACHE_LOCK = threading.Lock()
+
+
+def load_pages_cached(pages_dir: Path, *, copy: bool = False) -> list[Tuple[Path, JobBoard]]:
+    """
+    Like load_pages, but re-parses a JSON file only when its mtime or size
+    changed since the last call. The worker loop and the 30-second dashboard
+    fragments call this on every tick; unchanged boards are served from memory
+    instead of being re-read and re-validated.
+
+    With copy=True each board is handed out as a deep copy. Callers that
+    mutate boards (the scrape worker's apply_scrape sorts content in place and
+    rewrites histories) must pass it, or they would be editing the very
+    instances the UI threads are iterating.
+    """
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    pages_dir = pages_dir.resolve()
+
+    out: list[Tuple[Path, JobBoard]] = []
+    seen: set[Path] = set()
+    with os.scandir(pages_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json") and e.is_file()),
+            key=lambda e: e.name,
+        )
+    with _PAGES_CACHE_LOCK:
+        for entry in entries:
+            path = Path(entry.path)
+            stat = entry.stat()
+            sig = (stat.st_mtime_ns, stat.st_size)
+            cached = _PAGES_CACHE.get(path)
+            if cached is not None and (cached[0], cached[1]) == sig:
+                board = cached[2]
+            else:
+                try:
+                    board = JobBoard(**_json_loads(path.read_bytes()))
+                except (ValidationError, ValueError, OSError):
+                    # Skip invalid/unreadable JSONs, same as load_pages.
+                    # (orjson raises its own JSONDecodeError, a ValueError subclass.)
+                    continue
+                _PAGES_CACHE[path] = (sig[0], sig[1], board)
+            seen.add(path)
+            out.append((path, board.model_copy(deep=True) if copy else board))
+
+        # Only this directory's entries are candidates for eviction; other
+        # cached directories are untouched.
+        for stale in [p for p in _PAGES_CACHE if p.parent == pages_dir and p not in seen]:
+            del _PAGES_CACHE[stale]
+    return out
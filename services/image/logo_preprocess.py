@@ -308,14 +308,28 @@ def preprocess_logo(
       • We resize rasters ONCE server-side to the target backing resolution so the browser doesn't.
       • Padding (%) and halo (CSS px) are honored after resize.
     """
-    # Fetch once and decide path
-    raw = _fetch_bytes_any(src, timeout=timeout)
-
     # Generate a stable digest over content + params for caching
     params_key = (
         "v3", display_px, dpr, pad_pct, halo_px, halo_feather, alpha_threshold, sharpen_after_resize
     )
 
+    # URL inputs: a pointer file keyed on (url, params) lets a cold process
+    # reuse the processed output without re-downloading the source bytes —
+    # the content digest below can only be computed after a fetch.
+    pointer: Optional[Path] = None
+    if isinstance(src, (str, Path)) and str(src).startswith(("http://", "https://")):
+        h = hashlib.blake2b(digest_size=20)
+        h.update(str(src).encode("utf-8"))
+        h.update(repr(params_key).encode("utf-8"))
+        pointer = _cache_root() / f"logo-url-{h.hexdigest()}.txt"
+        if pointer.exists():
+            cached_path = Path(pointer.read_text(encoding="utf-8"))
+            if cached_path.exists():
+                return str(cached_path)
+
+    # Fetch once and decide path
+    raw = _fetch_bytes_any(src, timeout=timeout)
+
     # ── SVG branch: keep vector, inject outline + padding, save .svg ──
     if _is_svg_bytes(raw):
         text = gzip.decompress(raw).decode("utf-8", "replace") if raw[:2] == b"\x1f\x8b" else raw.decode("utf-8", "replace")
@@ -343,6 +357,8 @@ def preprocess_logo(
         out_path = _cache_root() / f"logo-{key}.svg"
         if not out_path.exists():
             _save_bytes(out_path, text.encode("utf-8"))
+        if pointer is not None:
+            _save_bytes(pointer, str(out_path).encode("utf-8"))
         return str(out_path)
 
     # ── Raster branch: trim → compute scaled pad/halo → apply → resize ONCE → (optional) sharpen → save PNG ──
@@ -392,4 +408,6 @@ def preprocess_logo(
     out_path = _cache_root() / f"logo-{key}.png"
     if not out_path.exists():
         img.save(out_path, format="PNG", optimize=True)
+    if pointer is not None:
+        _save_bytes(pointer, str(out_path).encode("utf-8"))
     return str(out_path)
@@ -5,13 +5,13 @@ from dataclasses import dataclass
 from typing import Dict, List, Set, Tuple, Optional
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
 
 from data.model import Job
 from .custom import scrape_via_ats_if_supported
 from .extractors import extract_all
 from .http_client import get_http
 from .pagination import discover_next_page_url
+from .parser import ParsedPage
 from .url import USER_AGENT, canonical_job_url, normalize_page_identity
 from .js_detect import looks_js_shell
 from .render_client import fetch_rendered_html
@@ -70,8 +70,12 @@ async def scrape_jobs_with_meta(
             except Exception:
                 break
 
+            # Parse once per page; shell detection, extraction, and
+            # pagination all share this object's tree.
+            page = ParsedPage(html)
+
             # Fallback to headless render if page looks JS-only
-            if looks_js_shell(html):
+            if looks_js_shell(page):
                 print(f"[scrape_jobs] JS shell: {url}")
                 html = await fetch_rendered_html(
                     url,
@@ -82,9 +86,10 @@ async def scrape_jobs_with_meta(
                 )
                 meta.rendered_pages += 1
                 meta.renderer_used = True  # at least one page required rendering
+                page = ParsedPage(html)
 
-            soup = BeautifulSoup(html, "html.parser")
-            page_jobs = extract_all(soup, url)
+            soup = page.soup
+            page_jobs = await extract_all(soup, url)
 
             for j in page_jobs:
                 try:
@@ -5,7 +5,6 @@ import re
 from typing import List, Optional, Protocol, Tuple, Type
 
 from data.model import Job
-from ..url import canonical_job_url
 
 class ATSAdapter(Protocol):
     pattern: re.Pattern[str]
@@ -55,12 +54,15 @@ async def scrape_via_ats_if_supported(
         return None
 
     jobs = await adapter.scrape(website_url, timeout=timeout, max_pages=max_pages)
-    out: List[Job] = []
+    # Adapters already return canonical links (each calls canonical_job_url),
+    # so dedup here is a single pass over the link strings — no re-canonicalization,
+    # no fresh Job construction for kept entries.
     seen: set[str] = set()
+    out: List[Job] = []
     for j in jobs:
-        link = canonical_job_url(str(j.link))
+        link = str(j.link)
         if link in seen:
             continue
         seen.add(link)
-        out.append(Job(title=j.title, link=link))
+        out.append(j)
     return out, adapter.name, adapter.renders
@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import html
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from bs4 import BeautifulSoup
 
 from data.model import Job
+from ..parser import first_h1_text, make_soup
 from ..url import canonical_job_url, USER_AGENT
-from ..render_client import fetch_rendered_html
+from ..render_client import fetch_rendered_html, fetch_rendered_html_many
 
 
 # Host: jobs.ashbyhq.com
@@ -59,13 +60,17 @@ def _normalize_job_url(href: str, base_url: str) -> Optional[str]:
     cleaned = urlunparse((p.scheme, p.netloc, p.path.rstrip("/"), p.params, "", ""))
     return cleaned
 
-def _extract_title_from_h1(html_text: str) -> Optional[str]:
-    soup = BeautifulSoup(html_text, "html.parser")
-    h1 = soup.find("h1")
-    if not h1:
-        return None
-    t = h1.get_text(" ", strip=True)
-    return t or None
+def _title_from_anchor(a) -> Optional[str]:
+    """
+    Ashby tiles render the job title as a heading inside the anchor.
+    Class names are hashed, so rely on tag shape only.
+    """
+    el = a.find(["h3", "h2"])
+    if el:
+        t = el.get_text(" ", strip=True)
+        if t:
+            return t
+    return None
 
 def _extract_uuid(path: str) -> Optional[str]:
     m = _UUID_RE.search(path or "")
@@ -92,8 +97,6 @@ class AshbyAdapter:
     @staticmethod
     async def scrape(url: str, *, timeout: int = 20, max_pages: int = 1) -> List[Job]:
         jobs: List[Job] = []
-        seen_ids: set[str] = set()
-        seen_links: set[str] = set()
 
         org = _get_org_slug(url)
 
@@ -106,13 +109,17 @@ class AshbyAdapter:
             wait_for=listing_wait_for,
             user_agent=USER_AGENT,
         )
-        soup = BeautifulSoup(listing_html, "html.parser")
+        soup = make_soup(listing_html)
 
         # 2) Collect candidate job links
         anchors = _select_job_anchors(soup, org)
         if not anchors:
             return jobs
 
+        # Collapse duplicate anchors for the same posting into one entry
+        # BEFORE any detail fetch happens. Keyed by UUID when present, else
+        # by canonical link.
+        by_key: dict[str, Tuple[str, Optional[str]]] = {}
         for a in anchors:
             raw_href = a.get("href")
             normalized = _normalize_job_url(raw_href, base_url=url)
@@ -122,28 +129,37 @@ class AshbyAdapter:
             p = urlparse(normalized)
             job_id = _extract_uuid(p.path)
             link = canonical_job_url(normalized)
-
-            # Deduplicate by UUID if present, otherwise by link
-            if job_id and job_id in seen_ids:
-                continue
-            if not job_id and link in seen_links:
-                continue
-
-            # 3) Follow detail page and extract title from first <h1>
-            details_html = await fetch_rendered_html(
-                link,
+            title = _title_from_anchor(a)
+
+            key = job_id or link
+            prev = by_key.get(key)
+            if prev is None:
+                by_key[key] = (link, title)
+            elif prev[1] is None and title:
+                # A duplicate anchor can still contribute the missing title.
+                by_key[key] = (prev[0], title)
+
+        links = [link for link, _ in by_key.values()]
+        titles = [title for _, title in by_key.values()]
+
+        # 3) Render detail pages ONLY for tiles whose anchor carried no usable
+        #    title; the batch shares one render context.
+        missing = [i for i, t in enumerate(titles) if not t]
+        if missing:
+            details = await fetch_rendered_html_many(
+                [links[i] for i in missing],
                 timeout_ms=timeout * 1000,
                 wait_for="h1",
                 user_agent=USER_AGENT,
+                # Only the heading is needed; skip whole-DOM serialization.
+                content_selector="h1",
             )
-            title = _extract_title_from_h1(details_html)
+            for i, details_html in zip(missing, details):
+                titles[i] = first_h1_text(details_html)
+
+        for link, title in zip(links, titles):
             if not title:
                 continue
-
             jobs.append(Job(title=title, link=link))
-            if job_id:
-                seen_ids.add(job_id)
-            else:
-                seen_links.add(link)
 
         return jobs
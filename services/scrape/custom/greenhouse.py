@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import html
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from data.model import Job
+from ..parser import first_h1_text, make_soup
 from ..url import canonical_job_url, USER_AGENT
-from ..render_client import fetch_rendered_html
+from ..render_client import fetch_rendered_html, fetch_rendered_html_many
 
 # Hosts like:
 #   - job-boards.greenhouse.io/<org>
@@ -22,10 +24,14 @@ _GREENHOUSE_HOST_RE = re.compile(r"(?i)(?:^|\.)(?:job-boards\.greenhouse\.io|boa
 # Also allow other board formats that still contain "/jobs/<digits>".
 _GH_JOB_PATH_RE = re.compile(r"/jobs/(\d+)(?:/|$)")
 
+# Compiled once at import so soupsieve doesn't re-parse them per call.
+_ROW_ANCHOR_SEL = sv.compile("tr.job-post td.cell a[href]")
+_ANCHOR_TITLE_SEL = sv.compile("p.body--medium, .body--medium")
+
 def _select_job_anchors(soup: BeautifulSoup):
     # Greenhouse company boards render rows like:
     # <tr class="job-post"><td class="cell"><a href=".../org/jobs/1234567890"> ... </a></td></tr>
-    return soup.select('tr.job-post td.cell a[href]')
+    return _ROW_ANCHOR_SEL.select(soup)
 
 def _normalize_job_url(href: str, base_url: str) -> Optional[str]:
     """
@@ -47,12 +53,13 @@ def _normalize_job_url(href: str, base_url: str) -> Optional[str]:
     cleaned = urlunparse((p.scheme, p.netloc, p.path.rstrip("/"), p.params, "", ""))
     return cleaned
 
-def _extract_title_from_h1(html_text: str) -> Optional[str]:
-    soup = BeautifulSoup(html_text, "html.parser")
-    h1 = soup.find("h1")
-    if not h1:
-        return None
-    t = h1.get_text(" ", strip=True)
+def _title_from_anchor(a) -> Optional[str]:
+    """
+    Greenhouse rows carry the title inside the anchor itself
+    (<p class="body body--medium">Title</p>); fall back to the anchor text.
+    """
+    el = _ANCHOR_TITLE_SEL.select_one(a)
+    t = el.get_text(" ", strip=True) if el else a.get_text(" ", strip=True)
     return t or None
 
 def _extract_job_id_from_path(path: str) -> Optional[str]:
@@ -82,8 +89,6 @@ class GreenhouseAdapter:
         # Greenhouse boards typically list everything on one page (with filters),
         # so we load once and parse all visible postings.
         jobs: List[Job] = []
-        seen_ids: set[str] = set()
-        seen_links: set[str] = set()
 
         # 1) Load listing page and wait until job rows are present
         listing_html = await fetch_rendered_html(
@@ -92,13 +97,17 @@ class GreenhouseAdapter:
             wait_for='tr.job-post a[href*="/jobs/"]',
             user_agent=USER_AGENT,
         )
-        soup = BeautifulSoup(listing_html, "html.parser")
+        soup = make_soup(listing_html)
 
         # 2) Collect candidate job links
         anchors = _select_job_anchors(soup)
         if not anchors:
             return jobs
 
+        # Collapse duplicate anchors (title link + card link to the same
+        # posting) into one entry BEFORE any detail fetch happens. Keyed by
+        # job id when available, else by canonical link.
+        by_key: dict[str, Tuple[str, Optional[str]]] = {}
         for a in anchors:
             raw_href = a.get("href")
             normalized = _normalize_job_url(raw_href, base_url=url)
@@ -108,29 +117,38 @@ class GreenhouseAdapter:
             p = urlparse(normalized)
             job_id = _extract_job_id_from_path(p.path)
             link = canonical_job_url(normalized)
-
-            # Deduplicate by job id if possible, otherwise by link
-            if job_id and job_id in seen_ids:
-                continue
-            if not job_id and link in seen_links:
-                continue
-
-            # 3) Follow job link and extract first <h1> as title
-            details_html = await fetch_rendered_html(
-                link,
+            title = _title_from_anchor(a)
+
+            key = job_id or link
+            prev = by_key.get(key)
+            if prev is None:
+                by_key[key] = (link, title)
+            elif prev[1] is None and title:
+                # A duplicate anchor can still contribute the missing title.
+                by_key[key] = (prev[0], title)
+
+        links = [link for link, _ in by_key.values()]
+        titles = [title for _, title in by_key.values()]
+
+        # 3) Render detail pages ONLY for rows whose anchor carried no usable
+        #    title; the batch shares one render context (keep-alive page).
+        missing = [i for i, t in enumerate(titles) if not t]
+        if missing:
+            details = await fetch_rendered_html_many(
+                [links[i] for i in missing],
                 timeout_ms=timeout * 1000,
                 # Greenhouse job pages are SSR but play safe and wait for <h1>
                 wait_for="h1",
                 user_agent=USER_AGENT,
+                # Only the heading is needed; skip whole-DOM serialization.
+                content_selector="h1",
             )
-            title = _extract_title_from_h1(details_html)
+            for i, details_html in zip(missing, details):
+                titles[i] = first_h1_text(details_html)
+
+        for link, title in zip(links, titles):
             if not title:
                 continue
-
             jobs.append(Job(title=title, link=link))
-            if job_id:
-                seen_ids.add(job_id)
-            else:
-                seen_links.add(link)
 
         return jobs
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import html
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from data.model import Job
+from ..parser import first_h1_text, make_soup
 from ..url import canonical_job_url, USER_AGENT
 from ..render_client import fetch_rendered_html
 
@@ -21,15 +25,26 @@ _JOIN_HOST_RE = re.compile(r"(?i)(?:^|\.)(?:join\.com)$")
 _JOIN_JOB_PATH_RE = re.compile(r"^/companies/[^/]+/\d{5,}-[A-Za-z0-9-]+/?$")
 
 
+def _is_join_host(host: str) -> bool:
+    # Plain string test beats an unanchored regex on every dispatched URL.
+    return host == "join.com" or host.endswith(".join.com")
+
+
+# Compiled once at import so soupsieve doesn't re-parse it per page.
+_CARD_ANCHOR_SEL = sv.compile('a[data-testid="Link"][href]')
+
+
 def _select_job_anchors(soup: BeautifulSoup):
     # Cards render as <a data-testid="Link" href="https://join.com/companies/.../<id>-<slug>">
-    return soup.select('a[data-testid="Link"][href]')
+    return _CARD_ANCHOR_SEL.select(soup)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_job_url(href: str, base_url: str) -> Optional[str]:
     """
     Return absolute, cleaned job details URL if it matches the expected join.com pattern.
     Strip query + fragment to canonicalize before passing to canonical_job_url.
+    Pure function of (href, base_url), so results are memoized.
     """
     if not href:
         return None
@@ -39,7 +54,7 @@ def _normalize_job_url(href: str, base_url: str) -> Optional[str]:
 
     p = urlparse(abs_url)
     host = (p.netloc or "").split(":")[0].lower()
-    if not _JOIN_HOST_RE.search(host):
+    if not _is_join_host(host):
         return None
     if not _JOIN_JOB_PATH_RE.match(p.path):
         return None
@@ -48,14 +63,6 @@ def _normalize_job_url(href: str, base_url: str) -> Optional[str]:
     return cleaned
 
 
-def _extract_title_from_h1(html_text: str) -> Optional[str]:
-    soup = BeautifulSoup(html_text, "html.parser")
-    h1 = soup.find("h1")
-    if not h1:
-        return None
-    t = h1.get_text(" ", strip=True)
-    return t or None
-
 
 class JoinAdapter:
     """
@@ -72,7 +79,7 @@ class JoinAdapter:
     def matches(url: str) -> bool:
         p = urlparse(url)
         host = (p.netloc or "").split(":")[0].lower()
-        return bool(_JOIN_HOST_RE.search(host))
+        return _is_join_host(host)
 
     @staticmethod
     async def scrape(url: str, *, timeout: int = 20, max_pages: int = 1) -> List[Job]:
@@ -88,9 +95,10 @@ class JoinAdapter:
             wait_for='a[data-testid="Link"][href*="/companies/"][href*="-"]',
             user_agent=USER_AGENT,
         )
-        soup = BeautifulSoup(listing_html, "html.parser")
+        soup = make_soup(listing_html)
 
-        # 2) Collect candidate job links
+        # 2) Collect candidate job links (deduped, order-preserving)
+        links: List[str] = []
         for a in _select_job_anchors(soup):
             raw_href = a.get("href")
             normalized = _normalize_job_url(raw_href, base_url=url)
@@ -100,19 +108,37 @@ class JoinAdapter:
             link = canonical_job_url(normalized)
             if link in seen_links:
                 continue
-
-            # 3) Follow each job link, wait for <h1>, and extract title
-            details_html = await fetch_rendered_html(
-                link,
-                timeout_ms=timeout * 1000,
-                wait_for="h1",
-                user_agent=USER_AGENT,
-            )
-            title = _extract_title_from_h1(details_html)
+            seen_links.add(link)
+            links.append(link)
+
+        if not links:
+            return jobs
+
+        # 3) Follow job links concurrently behind a small semaphore. Headless
+        #    rendering is almost entirely I/O-bound, so this is near-linear
+        #    up to the cap instead of N x one-page latency.
+        sem = asyncio.Semaphore(8)
+
+        async def _fetch_title(link: str) -> Tuple[str, Optional[str]]:
+            async with sem:
+                details_html = await fetch_rendered_html(
+                    link,
+                    timeout_ms=timeout * 1000,
+                    wait_for="h1",
+                    user_agent=USER_AGENT,
+                    # Only the heading is needed; skip whole-DOM serialization.
+                    content_selector="h1",
+                )
+            return link, first_h1_text(details_html)
+
+        # A failed detail render fails the whole scrape: apply_scrape treats
+        # a missing job as confirmed-gone, so dropping just the failed link
+        # would deactivate a live posting on a transient timeout. Pages that
+        # rendered without an <h1> are genuine misses and are skipped.
+        results = await asyncio.gather(*(_fetch_title(link) for link in links))
+        for link, title in results:
             if not title:
                 continue
-
             jobs.append(Job(title=title, link=link))
-            seen_links.add(link)
 
         return jobs
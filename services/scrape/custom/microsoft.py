@@ -6,10 +6,12 @@ import string
 from typing import Iterable, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode, quote
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from data.model import Job
 from ..http_client import get_http  # not used directly here, but kept for parity with other adapters
+from ..parser import make_soup
 from ..url import canonical_job_url, USER_AGENT
 from ..render_client import fetch_rendered_html
 
@@ -43,7 +45,7 @@ def _extract_job_id(item: BeautifulSoup) -> Optional[str]:
          - prefer shorter (6-8) over longer (e.g., IDs with suffixes)
     """
     # 1) aria-label anchor
-    for el in item.select('[aria-label]'):
+    for el in _ARIA_LABEL_SEL.select(item):
         m = _JOB_ITEM_ID_RE.search(el.get("aria-label", ""))
         if m:
             return m.group(1)
@@ -59,6 +61,10 @@ def _extract_job_id(item: BeautifulSoup) -> Optional[str]:
             else:
                 vals = [str(v)]
             for val in vals:
+                # Most attribute values (classes, ARIA text, data-* slugs)
+                # carry no digits at all; skip the regex engine for those.
+                if not any(c.isdigit() for c in val):
+                    continue
                 for m in _ANY_DIGITS_RE.finditer(val):
                     digits = m.group(1)
                     # Prefer reasonable job id lengths first
@@ -84,9 +90,18 @@ def _build_page_url(base_url: str, page: int) -> str:
     return urlunparse((p.scheme, p.netloc, p.path, p.params, query, p.fragment))
 
 
+# Compiled once; soupsieve re-parses compound selector strings on every
+# soup.select(...) call otherwise.
+_MS_ITEM_SEL = sv.compile(
+    '#job-search-app [role="listitem"].ms-List-cell, div[role="listitem"].ms-List-cell'
+)
+_ARIA_LABEL_SEL = sv.compile("[aria-label]")
+
+
 def _select_job_items(soup: BeautifulSoup) -> Iterable:
-    # Primary card containers
-    return soup.select('#job-search-app [role="listitem"].ms-List-cell, div[role="listitem"].ms-List-cell')
+    # Primary card containers; lazy iterator so huge result pages never get
+    # materialized into one giant list.
+    return _MS_ITEM_SEL.iselect(soup)
 
 
 def _extract_title(item: BeautifulSoup) -> Optional[str]:
@@ -131,15 +146,12 @@ class MicrosoftAdapter:
                 wait_for="#job-search-app [role='listitem'], [data-automationid='ListCell']",
                 user_agent=USER_AGENT,
             )
-            soup = BeautifulSoup(html, "html.parser")
-            items = list(_select_job_items(soup))
-
-            # If nothing rendered, stop early
-            if not items:
-                break
+            soup = make_soup(html)
 
+            any_items = False
             page_added = 0
-            for item in items:
+            for item in _select_job_items(soup):
+                any_items = True
                 jid = _extract_job_id(item)
                 title = _extract_title(item)
                 if not (jid and title):
@@ -156,8 +168,9 @@ class MicrosoftAdapter:
                 seen_ids.add(jid)
                 page_added += 1
 
-            # Heuristic: if this page yielded zero new jobs, pagination likely exhausted
-            if page_added == 0:
+            # Stop early if nothing rendered; same heuristic if the page
+            # yielded zero new jobs (pagination likely exhausted).
+            if not any_items or page_added == 0:
                 break
 
         return jobs
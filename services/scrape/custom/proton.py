@@ -5,9 +5,20 @@ import unicodedata
 from typing import Iterable, List, Optional
 from urllib.parse import urlparse, urlunparse, urljoin
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
+# Prefer rapidfuzz's C implementation for the terms x candidates distance
+# matrix; fall back to the pure-Python banded implementation below.
+try:
+    from rapidfuzz import process as _rf_process
+    from rapidfuzz.distance import DamerauLevenshtein as _rf_DL
+    _RAPIDFUZZ_OK = True
+except Exception:
+    _RAPIDFUZZ_OK = False
+
 from data.model import Job
+from ..parser import make_soup
 from ..url import canonical_job_url, USER_AGENT
 from ..render_client import fetch_rendered_html
 
@@ -15,10 +26,19 @@ from ..render_client import fetch_rendered_html
 # Strictly match Proton's board on Greenhouse EU
 _PROTON_HOST_RE = re.compile(r"(^|\.)job-boards\.eu\.greenhouse\.io$", re.IGNORECASE)
 
+# Compile row/field selectors once; re-parsing them per anchor is pure overhead.
+_ROW_ANCHOR_SEL = sv.compile(".job-posts--table--department tr.job-post a[href]")
+_TITLE_SEL = sv.compile(".body.body--medium")
+_PILL_SEL = sv.compile(".tag-container")
+_LOC_SEL = sv.compile(".body.body__secondary.body--metadata")
+
 
 def _strip_accents(s: str) -> str:
     if not s:
         return ""
+    # ASCII fast-path: nothing to fold, skip normalize + the join allocation.
+    if s.isascii():
+        return s
     # Fold accents -> ASCII where possible
     return "".join(ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch))
 
@@ -106,28 +126,39 @@ def _damerau_levenshtein_capped(a: str, b: str, max_dist: int = 2) -> int:
     return dist
 
 
-def _any_fuzzy_match(candidates: Iterable[str], terms: Iterable[str], *, max_edit_distance: int) -> bool:
+def _any_fuzzy_match(candidates: Iterable[str], norm_terms: List[str], *, max_edit_distance: int) -> bool:
     """
-    True if any candidate location matches any search term:
+    True if any candidate location matches any (pre-normalized) search term:
       - substring match (normalized) OR
       - Damerau-Levenshtein distance <= max_edit_distance
     """
-    norm_cands = [ _norm(c) for c in candidates ]
-    norm_terms = [ _norm(t) for t in terms if t and _norm(t) ]
-
     if not norm_terms:
         # No filters configured -> accept everything
         return True
 
+    norm_cands = [c for c in (_norm(c) for c in candidates) if c]
+    if not norm_cands:
+        return False
+
+    # quick substring acceptance either way
     for c in norm_cands:
-        if not c:
-            continue
         for t in norm_terms:
-            if not t:
-                continue
-            # quick substring acceptance either way
             if t in c or c in t:
                 return True
+
+    if _RAPIDFUZZ_OK:
+        # Full terms x candidates distance matrix in one C call; entries above
+        # the cutoff come back as cutoff + 1.
+        m = _rf_process.cdist(
+            norm_terms,
+            norm_cands,
+            scorer=_rf_DL.distance,
+            score_cutoff=max_edit_distance,
+        )
+        return bool((m <= max_edit_distance).any())
+
+    for c in norm_cands:
+        for t in norm_terms:
             # fuzzy edit distance (cap)
             if _damerau_levenshtein_capped(t, c, max_edit_distance) <= max_edit_distance:
                 return True
@@ -149,6 +180,8 @@ class ProtonAdapter:
     def __init__(self, location_terms: Optional[List[str]] = None, *, max_edit_distance: int = 2) -> None:
         self.location_terms: List[str] = location_terms or []
         self.max_edit_distance: int = max_edit_distance
+        # Normalize once; scrape() reuses this for every row.
+        self._norm_terms: List[str] = [t for t in (_norm(x) for x in self.location_terms) if t]
 
     @staticmethod
     def matches(url: str) -> bool:
@@ -177,8 +210,8 @@ class ProtonAdapter:
             user_agent=USER_AGENT,
         )
 
-        soup = BeautifulSoup(html, "html.parser")
-        anchors = soup.select(".job-posts--table--department tr.job-post a[href]")
+        soup = make_soup(html)
+        anchors = _ROW_ANCHOR_SEL.select(soup)
 
         jobs: List[Job] = []
 
@@ -188,10 +221,10 @@ class ProtonAdapter:
                 continue
 
             # Title: remove the "New" pill if present
-            title_tag = a.select_one(".body.body--medium")
+            title_tag = _TITLE_SEL.select_one(a)
             if title_tag:
                 # Drop the badge container to avoid 'New' leaking into title
-                for pill in title_tag.select(".tag-container"):
+                for pill in _PILL_SEL.select(title_tag):
                     pill.decompose()
                 title = title_tag.get_text(" ", strip=True)
             else:
@@ -199,12 +232,12 @@ class ProtonAdapter:
                 title = a.get_text(" ", strip=True)
 
             # Locations
-            loc_tag = a.select_one(".body.body__secondary.body--metadata")
+            loc_tag = _LOC_SEL.select_one(a)
             loc_text = loc_tag.get_text(" ", strip=True) if loc_tag else ""
             locs = _split_locations(loc_text)
 
             # Fuzzy location filter (if configured)
-            if not _any_fuzzy_match(locs, self.location_terms, max_edit_distance=self.max_edit_distance):
+            if not _any_fuzzy_match(locs, self._norm_terms, max_edit_distance=self.max_edit_distance):
                 continue
 
             # Absolute + canonical URL
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import html
 import re
+from functools import lru_cache
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode, quote
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, Tag
 
 from data.model import Job
+from ..parser import make_soup
 from ..url import canonical_job_url, USER_AGENT
 from ..render_client import fetch_rendered_html
 
@@ -23,23 +26,58 @@ _WORKDAY_HOST_RE = re.compile(
 _REQ_ID_RE = re.compile(r"\b((?:JR|R|REQ)[-_]?\d{4,8}(?:-\d+)?)\b", re.IGNORECASE)
 
 
+def _is_wd_label(label: str) -> bool:
+    return label.startswith("wd") and label[2:].isdigit()
+
+
+def _is_workday_host(host: str) -> bool:
+    """
+    String-level equivalent of _WORKDAY_HOST_RE on an already split/lowered
+    host; endswith + label checks avoid regex backtracking per URL.
+    """
+    parts = host.split(".")
+    if host.endswith(".myworkdayjobs.com"):
+        # <tenant>.wd<N>.myworkdayjobs.com — a tenant label must precede wd<N>
+        return len(parts) >= 4 and _is_wd_label(parts[-3])
+    if host.endswith(".myworkdaysite.com"):
+        # wd<N>.myworkdaysite.com (optionally with extra leading labels)
+        return len(parts) >= 3 and _is_wd_label(parts[-3])
+    return False
+
+
+# page=<digits> at the start of the query or after a separator
+_PAGE_PARAM_RE = re.compile(r"(^|&)page=\d*")
+
+
 def _build_page_url(base_url: str, page: int) -> str:
     """
     Preserve all existing query parameters and set page=<page>.
+
+    Fast path: substitute/append page=<n> at the string level; the full
+    parse_qs/urlencode roundtrip only runs for the odd query with duplicate
+    page keys.
     """
     p = urlparse(base_url)
-    q = parse_qs(p.query, keep_blank_values=True)
-    q["page"] = [str(page)]
-    query = urlencode({k: v for k, v in q.items()}, doseq=True, quote_via=quote)
-    return urlunparse((p.scheme, p.netloc, p.path, p.params, query, p.fragment))
+    new_q, n = _PAGE_PARAM_RE.subn(lambda m: f"{m.group(1)}page={page}", p.query)
+    if n == 0:
+        new_q = f"{p.query}&page={page}" if p.query else f"page={page}"
+    elif n > 1:
+        q = parse_qs(p.query, keep_blank_values=True)
+        q["page"] = [str(page)]
+        new_q = urlencode({k: v for k, v in q.items()}, doseq=True, quote_via=quote)
+    return urlunparse((p.scheme, p.netloc, p.path, p.params, new_q, p.fragment))
+
+
+# Compiled once at import so soupsieve doesn't re-parse it per page.
+_JOB_LINK_SEL = sv.compile('a[data-automation-id="jobTitle"][href]')
 
 
 def _select_job_links(soup: BeautifulSoup):
     # Workday job cards consistently include data-automation-id="jobTitle"
-    return soup.select('a[data-automation-id="jobTitle"][href]')
+    return _JOB_LINK_SEL.select(soup)
 
 
-def _extract_title(a) -> Optional[str]:
+def _extract_title(a: Tag) -> Optional[str]:
     t = a.get_text(" ", strip=True)
     return t or None
 
@@ -49,11 +87,12 @@ def _extract_req_id(text: str) -> Optional[str]:
     return m.group(1) if m else None
 
 
+@lru_cache(maxsize=4096)
 def _to_details_url(abs_url: str) -> str:
     """
     Convert listing URL forms like:
       /en-US/<app>/job/<Location>/Title_REQ?...  -->  /en-US/<app>/details/Title_REQ?...
-    If already a details URL, return as-is.
+    If already a details URL, return as-is. Pure per input, so memoized.
     """
     p = urlparse(abs_url)
     segments = [s for s in p.path.split("/") if s != ""]  # keep order, drop empties for easier ops
@@ -93,7 +132,7 @@ class WorkdayAdapter:
     def matches(url: str) -> bool:
         p = urlparse(url)
         host = (p.netloc or "").split(":")[0].lower()
-        return bool(_WORKDAY_HOST_RE.search(host))
+        return _is_workday_host(host)
 
     @staticmethod
     async def scrape(url: str, *, timeout: int = 20, max_pages: int = 5) -> List[Job]:
@@ -119,7 +158,7 @@ class WorkdayAdapter:
                 wait_for='a[data-automation-id="jobTitle"][href]',
                 user_agent=USER_AGENT,
             )
-            soup = BeautifulSoup(html_text, "html.parser")
+            soup = make_soup(html_text)
             links = _select_job_links(soup)
 
             if not links:
@@ -1,26 +1,53 @@
 # services/scrape/extractors/__init__.py
 from __future__ import annotations
+import asyncio
+import logging
 from typing import List
 from bs4 import BeautifulSoup
 
 from data.model import Job
+from .index import PageIndex
 from .jsonld import extract_jsonld_jobs
 from .listitem import extract_listitem_jobs
 from .repeated_blocks import extract_repeated_block_jobs
 from .anchor import extract_anchor_jobs_strict
 
-# Highest signal first; early exit on first non-empty result.
-EXTRACTOR_PIPELINE = (
-    extract_jsonld_jobs,
-    extract_listitem_jobs,
-    extract_repeated_block_jobs,
-    extract_anchor_jobs_strict,
-)
+logger = logging.getLogger(__name__)
 
-def extract_all(soup: BeautifulSoup, base_url: str) -> List[Job]:
-    for fn in EXTRACTOR_PIPELINE:
-        print(f"Extracting {base_url} with {fn.__name__}")
-        jobs = fn(soup, base_url)  # type: ignore[arg-type]
+async def extract_all(soup: BeautifulSoup, base_url: str) -> List[Job]:
+    # Highest signal first (jsonld > listitem > repeated blocks > anchors);
+    # early exit on first non-empty result.
+    # One shared index: the anchor scan + URL resolution happen once for the
+    # whole pipeline instead of once per extractor.
+    index = PageIndex(soup, base_url)
+
+    # Speculative overlap: JSON-LD misses on most pages, so start the
+    # listitem walk while awaiting it. Both stages only read the tree, and
+    # their PageIndex memo writes are GIL-atomic dict ops; the heavy lifting
+    # (lxml/orjson) releases the GIL in C.
+    jsonld_task = asyncio.create_task(
+        asyncio.to_thread(extract_jsonld_jobs, soup, base_url, index=index)
+    )
+    listitem_task = asyncio.create_task(
+        asyncio.to_thread(extract_listitem_jobs, soup, base_url, index=index)
+    )
+
+    jobs = await jsonld_task
+    if jobs:
+        # Best effort; an already-running thread finishes and is discarded.
+        listitem_task.cancel()
+        return jobs
+
+    try:
+        jobs = await listitem_task
+    except asyncio.CancelledError:
+        jobs = []
+    if jobs:
+        return jobs
+
+    for fn in (extract_repeated_block_jobs, extract_anchor_jobs_strict):
+        logger.debug("Extracting %s with %s", base_url, fn.__name__)
+        jobs = await asyncio.to_thread(fn, soup, base_url, index=index)
         if jobs:
             return jobs
     return []
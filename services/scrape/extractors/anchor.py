@@ -5,21 +5,31 @@ import re
 from typing import List
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, Tag
 
 from data.model import Job
+from services.scrape.extractors.index import PageIndex
 from services.scrape.normalization import (
-    _looks_like_job_detail_url,
     _title_from_aria,
     _clean_anchor_text,
 )
-from services.scrape.url import _absolute, canonical_job_url
+from services.scrape.url import canonical_job_url
 
 
 _CTA_TITLES = {"view job", "learn more", "read more", "apply now", "connect"}
 
+# High-signal anchor shapes, matched with ONE compiled query instead of
+# running Python predicates over every anchor on the page.
+_KNOWN_JOB_ANCHOR_SEL = sv.compile(
+    'a[data-automation-id="jobTitle"][href], a.jobTitle[href], '
+    'a.careers-link[href], a[data-component-link-type="card"][href]'
+)
+# Anchors wrapping a heading — the candidates for _has_meaningful_heading.
+_HEADING_ANCHOR_SEL = sv.compile("a[href]:has(h1, h2, h3, h4, h5, h6)")
+
 
-def _heading_text_in(node) -> str | None:
+def _heading_text_in(node: Tag) -> str | None:
     """Return text of the highest-priority heading (h1..h6) under node."""
     for level in range(1, 7):  # prefer higher heading levels
         h = node.find(f"h{level}")
@@ -30,63 +40,84 @@ def _heading_text_in(node) -> str | None:
     return None
 
 
-def _has_meaningful_heading(a) -> bool:
+def _has_meaningful_heading(a: Tag) -> bool:
     """Heuristic: anchor contains a heading that looks like a job title."""
-    try:
-        t = _heading_text_in(a)
-        if not t:
-            return False
-        t_clean = t.strip()
-        if len(t_clean) < 4:
-            return False
-        if t_clean.lower() in _CTA_TITLES:
-            return False
-        # Optional: reject titles that are mostly punctuation
-        if sum(ch.isalnum() for ch in t_clean) < 3:
-            return False
-        return True
-    except Exception:
+    t = _heading_text_in(a)
+    if not t:
+        return False
+    t_clean = t.strip()
+    if len(t_clean) < 4:
+        return False
+    if t_clean.lower() in _CTA_TITLES:
         return False
+    # Optional: reject titles that are mostly punctuation
+    if sum(ch.isalnum() for ch in t_clean) < 3:
+        return False
+    return True
 
 
-def _title_from_heading(a) -> str | None:
+def _title_from_heading(a: Tag) -> str | None:
     """Prefer headings inside the anchor: h1 > h2 > ... > h6."""
     t = _heading_text_in(a)
     return t.strip() if t else None
 
 
-def extract_anchor_jobs_strict(soup: BeautifulSoup, base_url: str) -> List[Job]:
+def extract_anchor_jobs_strict(
+    soup: BeautifulSoup, base_url: str, *, index: PageIndex | None = None
+) -> List[Job]:
+    index = index or PageIndex(soup, base_url)
+
+    # Fast path: one compiled CSS pass over high-signal anchors (known job
+    # anchor shapes + heading-bearing anchors). Only if that yields nothing
+    # do we fall back to scanning every anchor in the document.
+    candidates = _KNOWN_JOB_ANCHOR_SEL.select(soup) + _HEADING_ANCHOR_SEL.select(soup)
+    if candidates:
+        seen_ids: set[int] = set()
+        deduped = [a for a in candidates if not (id(a) in seen_ids or seen_ids.add(id(a)))]
+        jobs = _jobs_from_anchors(deduped, index)
+        if jobs:
+            return jobs
+
+    return _jobs_from_anchors(index.anchors, index)
+
+
+def _jobs_from_anchors(anchors: List[Tag], index: PageIndex) -> List[Job]:
     jobs: List[Job] = []
     seen: set[str] = set()
 
-    for a in soup.find_all("a", href=True):
-        try:
-            href_abs = _absolute(a.get("href", ""), base_url)
-
-            looks_like_job = (
-                a.get("data-automation-id") == "jobTitle"
-                or "jobTitle" in a.get("class", [])
-                or _looks_like_job_detail_url(href_abs)
-                or _has_meaningful_heading(a)
-            )
-            if not looks_like_job:
-                continue
-
-            link = canonical_job_url(href_abs)
-            if link in seen:
-                continue
-
-            title = (
-                _title_from_heading(a)     # ← prefer highest-level heading
-                or _title_from_aria(a)
-                or _clean_anchor_text(a)
-            )
-            if not title:
-                continue
-
-            seen.add(link)
-            jobs.append(Job(title=title, link=link))
-        except Exception:
+    # No try/except envelope here: the failure modes are a missing href
+    # (guarded below) and an unparsable URL (index.absolute returns None),
+    # so the per-anchor frame stays guard-only.
+    for a in anchors:
+        href = a.get("href")
+        if not href:
+            continue
+        href_abs = index.absolute(href)
+        if href_abs is None:
             continue
 
+        looks_like_job = (
+            a.get("data-automation-id") == "jobTitle"
+            or "jobTitle" in a.get("class", [])
+            or index.is_job_detail(href_abs)
+            or _has_meaningful_heading(a)
+        )
+        if not looks_like_job:
+            continue
+
+        link = canonical_job_url(href_abs)
+        if link in seen:
+            continue
+
+        title = (
+            _title_from_heading(a)     # ← prefer highest-level heading
+            or _title_from_aria(a)
+            or _clean_anchor_text(a)
+        )
+        if not title:
+            continue
+
+        seen.add(link)
+        jobs.append(Job(title=title, link=link))
+
     return jobs
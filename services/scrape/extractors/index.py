@@ -0,0 +1,47 @@
+# services/scrape/extractors/index.py
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from services.scrape.normalization import _looks_like_job_detail_url
+from services.scrape.url import _absolute
+
+
+class PageIndex:
+    """
+    Per-page scratch state shared across the extractor pipeline.
+
+    The document's anchors are collected once, and absolute-URL resolution /
+    job-detail classification are memoized per href, so the four extractors
+    don't each re-walk the DOM and re-resolve the same hrefs.
+    """
+
+    # Bound on anchors collected per page. Real job boards sit far below
+    # this; SPA re-render artifacts with endless duplicated DOM are the
+    # only pages that exceed it, and those are junk past the first 2000.
+    MAX_ANCHORS = 2000
+
+    def __init__(self, soup, base_url: str):
+        self.base_url = base_url
+        self.anchors: List = soup.find_all("a", href=True, limit=self.MAX_ANCHORS)
+        self._abs: Dict[str, Optional[str]] = {}
+        self._detail: Dict[str, bool] = {}
+
+    def absolute(self, href: str) -> Optional[str]:
+        """Resolve href against the page's base URL; None if it can't be."""
+        if href in self._abs:
+            return self._abs[href]
+        try:
+            res = _absolute(href, self.base_url)
+        except Exception:
+            res = None
+        self._abs[href] = res
+        return res
+
+    def is_job_detail(self, url: str) -> bool:
+        """Memoized _looks_like_job_detail_url on an absolute URL."""
+        hit = self._detail.get(url)
+        if hit is None:
+            hit = _looks_like_job_detail_url(url)
+            self._detail[url] = hit
+        return hit
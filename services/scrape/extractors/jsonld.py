@@ -1,43 +1,65 @@
 # services/scrape/extractors/jsonld.py
 from __future__ import annotations
 
-import json
 from typing import List, Dict, Any
 
 from bs4 import BeautifulSoup
 
+# orjson is ~3x faster than stdlib json on the big LD blobs; same fallback
+# pattern as the HTTP client.
+try:
+    import orjson as _json
+except Exception:
+    import json as _json
+
+# Optional: stream huge LD graphs (Workday ships >1 MiB blobs) item by item
+# instead of materializing the whole object tree before filtering.
+try:
+    import ijson
+    _IJSON_OK = True
+except Exception:
+    _IJSON_OK = False
+
+_STREAM_THRESHOLD = 64 * 1024
+
 from data.model import Job
-from services.scrape.normalization import _looks_like_job_detail_url
-from services.scrape.url import _absolute, canonical_job_url
+from services.scrape.extractors.index import PageIndex
+from services.scrape.url import canonical_job_url
+
 
+# Wrapper keys whose children may hold postings (@graph, ItemList entries...)
+_WRAPPER_KEYS = ("@graph", "mainEntity", "item", "itemListElement")
 
-def _iter_nodes(payload: Any) -> List[Dict[str, Any]]:
+
+def _iter_job_postings(payload: Any):
     """
-    Normalize LD+JSON payloads into a flat list of dict nodes.
-    Handles dict, list, and @graph; also follows common "mainEntity" wrappers.
+    Walk an LD+JSON payload iteratively and yield only the dicts whose @type
+    is (or contains) "JobPosting". Children are pushed for the known wrapper
+    keys only, so unrelated graph nodes are never materialized.
     """
-    nodes: List[Dict[str, Any]] = []
-
-    def add(node: Any) -> None:
-        if isinstance(node, dict):
-            nodes.append(node)
-            # common nesting
-            if isinstance(node.get("@graph"), list):
-                for g in node["@graph"]:
-                    add(g)
-            if isinstance(node.get("mainEntity"), dict):
-                add(node["mainEntity"])
-            if isinstance(node.get("item"), dict):
-                add(node["item"])
-        elif isinstance(node, list):
-            for n in node:
-                add(n)
-
-    add(payload)
-    return nodes
-
-
-def extract_jsonld_jobs(soup: BeautifulSoup, base_url: str) -> List[Job]:
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        t = node.get("@type")
+        if t == "JobPosting" or (isinstance(t, list) and "JobPosting" in t):
+            yield node
+
+        for key in _WRAPPER_KEYS:
+            child = node.get(key)
+            if isinstance(child, (dict, list)):
+                stack.append(child)
+
+
+def extract_jsonld_jobs(
+    soup: BeautifulSoup, base_url: str, *, index: PageIndex | None = None
+) -> List[Job]:
+    index = index or PageIndex(soup, base_url)
     jobs: List[Job] = []
 
     for tag in soup.find_all("script", {"type": "application/ld+json"}):
@@ -46,26 +68,41 @@ def extract_jsonld_jobs(soup: BeautifulSoup, base_url: str) -> List[Job]:
         if not raw:
             continue
 
+        # Cheap substring gate: Organization/BreadcrumbList blobs that can
+        # never yield a job are skipped without parsing at all.
+        if "JobPosting" not in raw:
+            continue
+
         try:
-            data = json.loads(raw)
+            if _IJSON_OK and len(raw) >= _STREAM_THRESHOLD and '"@graph"' in raw:
+                # Streaming keeps peak memory flat and stops allocating
+                # unrelated graph nodes; postings in big blobs live in @graph.
+                nodes = [
+                    n
+                    for item in ijson.items(raw.encode("utf-8"), "@graph.item")
+                    for n in _iter_job_postings(item)
+                ]
+                if not nodes:
+                    # The streaming prefix only matches a TOP-LEVEL @graph;
+                    # blobs that nest it (e.g. a list of graph objects) pass
+                    # the substring gate but stream zero items. Fall back to
+                    # the full walk rather than silently dropping postings.
+                    nodes = list(_iter_job_postings(_json.loads(raw)))
+            else:
+                nodes = list(_iter_job_postings(_json.loads(raw)))
         except Exception:
             # Some LD+JSON are minified but malformed (trailing commas, etc.).
             # Skip quietly; other extractors will catch jobs.
             continue
 
-        for node in _iter_nodes(data):
-            t = node.get("@type")
-            if t == "JobPosting" or (isinstance(t, list) and "JobPosting" in t):
-                title = (node.get("title") or node.get("name") or "").strip()
-                raw_url = (node.get("url") or node.get("applicationUrl") or "").strip()
-                if not title or not raw_url:
-                    continue
-
-                try:
-                    url_abs = _absolute(raw_url, base_url)
-                except Exception:
-                    continue
-                if _looks_like_job_detail_url(url_abs):
-                    jobs.append(Job(title=title, link=canonical_job_url(url_abs)))
+        for node in nodes:
+            title = (node.get("title") or node.get("name") or "").strip()
+            raw_url = (node.get("url") or node.get("applicationUrl") or "").strip()
+            if not title or not raw_url:
+                continue
+
+            url_abs = index.absolute(raw_url)
+            if url_abs is not None and index.is_job_detail(url_abs):
+                jobs.append(Job(title=title, link=canonical_job_url(url_abs)))
 
     return jobs
@@ -1,43 +1,49 @@
 # services/scrape/extractors/listitem.py
 from __future__ import annotations
+import logging
 from typing import List
 
 from bs4 import BeautifulSoup
 
 from data.model import Job
+from services.scrape.extractors.index import PageIndex
 from services.scrape.normalization import (
-    _looks_like_job_detail_url,
     _max_heading_text,
     _title_from_aria,
     _clean_anchor_text,
 )
-from services.scrape.url import _absolute, canonical_job_url
+from services.scrape.url import canonical_job_url
 
+logger = logging.getLogger(__name__)
 
-def extract_listitem_jobs(soup: BeautifulSoup, base_url: str) -> List[Job]:
+
+def extract_listitem_jobs(
+    soup: BeautifulSoup, base_url: str, *, index: PageIndex | None = None
+) -> List[Job]:
+    index = index or PageIndex(soup, base_url)
     jobs: List[Job] = []
     seen: set[str] = set()
 
     def list_is_job_list(ul_or_ol) -> bool:
+        # O(1) attribute check before any subtree walk
         label = (ul_or_ol.get("aria-label") or "").lower()
         if any(k in label for k in ("job", "career", "vacan", "opening", "position")):
             return True
 
-        # Workday signature: several jobTitle anchors inside this list
-        if len(ul_or_ol.select('a[data-automation-id="jobTitle"][href]')) >= 2:
-            return True
-
-        # Generic heuristic fallback
-        count = 0
+        # One walk over the list's anchors covers both signals — Workday
+        # jobTitle anchors and generic job-detail hrefs — with early exits.
+        wd_count = 0
+        detail_count = 0
         for a in ul_or_ol.find_all("a", href=True):
-            try:
-                href_abs = _absolute(a.get("href", ""), base_url)
-            except Exception:
-                continue
-
-            if _looks_like_job_detail_url(href_abs):
-                count += 1
-                if count >= 2:
+            if a.get("data-automation-id") == "jobTitle":
+                wd_count += 1
+                if wd_count >= 2:
+                    return True
+
+            href_abs = index.absolute(a.get("href", ""))
+            if href_abs is not None and index.is_job_detail(href_abs):
+                detail_count += 1
+                if detail_count >= 2:
                     return True
         return False
 
@@ -48,37 +54,29 @@ def extract_listitem_jobs(soup: BeautifulSoup, base_url: str) -> List[Job]:
         if candidate_lists
         else soup.select('li, div[role="listitem"]')
     )
-    print(f"[listitem] found {len(li_iterables)} list items")
+    logger.debug("[listitem] found %d list items", len(li_iterables))
 
     for li in li_iterables:
         chosen_a = li.select_one('a[data-automation-id="jobTitle"][href]')
         link_abs = None
 
         if chosen_a:
-            try:
-                link_abs = _absolute(chosen_a.get("href", ""), base_url)
-            except Exception:
-                link_abs = None
+            link_abs = index.absolute(chosen_a.get("href", ""))
         else:
             # fallback: first anchor that looks like a job detail
             for cand in li.find_all("a", href=True):
-                try:
-                    href_abs = _absolute(cand.get("href", ""), base_url)
-                except Exception:
+                href_abs = index.absolute(cand.get("href", ""))
+                if href_abs is None:
                     continue
 
-                if _looks_like_job_detail_url(href_abs):
+                if index.is_job_detail(href_abs):
                     chosen_a, link_abs = cand, href_abs
                     break
 
         if not chosen_a or not link_abs:
             continue
 
-        try:
-            link_abs = canonical_job_url(link_abs)
-        except Exception:
-            continue
-
+        link_abs = canonical_job_url(link_abs)
         if link_abs in seen:
             continue
 
@@ -101,7 +99,7 @@ def extract_listitem_jobs(soup: BeautifulSoup, base_url: str) -> List[Job]:
                     if title.strip():
                         break
 
-        print(link_abs, title)
+        logger.debug("%s %s", link_abs, title)
         if not title:
             continue
 
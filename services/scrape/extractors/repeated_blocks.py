@@ -1,36 +1,50 @@
 # services/scrape/extractors/repeated_blocks.py
 from __future__ import annotations
-from typing import List, Set, Tuple, Dict
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+import soupsieve as sv
 
 from data.model import Job
+from services.scrape.extractors.index import PageIndex
 from services.scrape.normalization import (
     _is_generic_classkey,
     _selector_from_key,
-    _looks_like_job_detail_url,
     _max_heading_text,
     _title_from_attrs,
     _clean_anchor_text,
 )
-from services.scrape.url import _absolute, canonical_job_url
+from services.scrape.url import canonical_job_url
+
+
+# Compiled once at import; select_one on an item would otherwise re-parse
+# these selectors for every repeated block on the page.
+_WD_TITLE_SEL = sv.compile('a[data-automation-id="jobTitle"][href]')
+_LEVER_TITLE_SEL = sv.compile("a.posting-title[href]")
 
 
-def extract_repeated_block_jobs(soup, base_url: str, *, min_children: int = 3) -> List[Job]:
+def extract_repeated_block_jobs(
+    soup, base_url: str, *, min_children: int = 3, index: PageIndex | None = None
+) -> List[Job]:
     """
     1) Walk containers and find child groups where many direct children share same (tag, class).
     2) Treat each such (tag, class) as an 'item prototype'.
     3) Query the whole document for ALL elements matching that prototype.
     4) From each item, pick detail link + title (max heading -> ARIA/title -> anchor text).
     """
+    index = index or PageIndex(soup, base_url)
     jobs: List[Job] = []
     seen_links: Set[str] = set()
-    candidate_keys: Set[Tuple[str, str]] = set()
+    candidate_keys: Set[Tuple[str, FrozenSet[str]]] = set()
 
-    # --- Step 1/2: discover item prototypes
-    for container in soup.find_all(["div", "section", "main", "article"]):
-        groups: Dict[Tuple[str, str], List] = {}
+    # --- Step 1/2: discover item prototypes. Bounded: job boards rarely have
+    # more than a few hundred containers above the fold, and unbounded walks
+    # over SPA re-render junk blow up both time and memory.
+    for container in soup.find_all(["div", "section", "main", "article"], limit=500):
+        groups: Dict[Tuple[str, FrozenSet[str]], List] = {}
         for child in container.find_all(recursive=False):
             tag = child.name or ""
-            cls_key = " ".join(sorted(child.get("class", [])))
+            # frozenset keys hash directly; no per-child sorted join
+            cls_key = frozenset(child.get("class") or ())
             if not tag or _is_generic_classkey(cls_key):
                 continue
             key = (tag, cls_key)
@@ -48,16 +62,16 @@ def extract_repeated_block_jobs(soup, base_url: str, *, min_children: int = 3) -
         selector = _selector_from_key(key)
         for item in soup.select(selector):
             a = (
-                item.select_one('a[data-automation-id="jobTitle"][href]') or
-                item.select_one("a.posting-title[href]") or
+                _WD_TITLE_SEL.select_one(item) or
+                _LEVER_TITLE_SEL.select_one(item) or
                 item.find("a", href=True)
             )
             if not a:
                 continue
 
             try:
-                link = _absolute(a.get("href", ""), base_url)
-                if not _looks_like_job_detail_url(link):
+                link = index.absolute(a.get("href", ""))
+                if link is None or not index.is_job_detail(link):
                     continue
                 link = canonical_job_url(link)
             except Exception:
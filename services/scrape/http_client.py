@@ -1,12 +1,38 @@
 # services/scrape/http_client.py
 from __future__ import annotations
 import atexit, asyncio, ssl
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from urllib.parse import urlparse
 
 import aiohttp, certifi
 from .url import USER_AGENT
 
+
+@lru_cache(maxsize=4096)
+def _host(url: str) -> str:
+    """Lower-cased netloc, memoized — pages are fetched and retried by URL."""
+    return urlparse(url).netloc.lower()
+
+# Prefer orjson for response decoding (~3x faster than stdlib json on the
+# large ATS payloads); fall back to stdlib if unavailable.
+try:
+    import orjson as _json
+    _json_loads = _json.loads
+except Exception:
+    import json as _json
+    _json_loads = _json.loads
+
+# Use the c-ares resolver when aiodns is installed: getaddrinfo otherwise
+# runs in the default thread pool and serializes lookups across hosts.
+try:
+    import aiodns  # noqa: F401
+    from aiohttp.resolver import AsyncResolver
+    _AIODNS_OK = True
+except Exception:
+    _AIODNS_OK = False
+
 # Detect Brotli availability (prefer brotlicffi; fall back to Brotli)
 try:
     import brotlicffi as _brotli  # noqa: F401
@@ -18,13 +44,26 @@ except Exception:
     except Exception:
         _BROTLI_OK = False
 
-_DEFAULT_HEADERS = {
+# Frozen defaults: passed straight to aiohttp when the caller has no
+# overrides, so the common request path allocates no header dict at all.
+_DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({
     "User-Agent": USER_AGENT,
     "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
     "Accept-Encoding": "gzip, deflate, br" if _BROTLI_OK else "gzip, deflate",
     "Upgrade-Insecure-Requests": "1",
-}
+})
+
+# Prebuilt variant for the 400/403/406/451 retry; only Referer varies.
+_RETRY_HEADERS_TEMPLATE: Mapping[str, str] = MappingProxyType({
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+})
 
 _SESSION: Optional[aiohttp.ClientSession] = None
 
@@ -39,17 +78,15 @@ class HttpClient:
     async def fetch_json(self, url: str, *, params: Dict[str, Any] | None = None,
                          json: Any | None = None, headers: Dict[str, str] | None = None,
                          method: str = "GET") -> Any:
-        hdrs = dict(_DEFAULT_HEADERS)
-        if headers:
-            hdrs.update(headers)
+        hdrs = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
         if method.upper() == "GET":
             async with self.session.get(url, params=params, headers=hdrs) as r:
                 r.raise_for_status()
-                return await r.json(content_type=None)
+                return await r.json(content_type=None, loads=_json_loads)
         else:
             async with self.session.post(url, params=params, json=json, headers=hdrs) as r:
                 r.raise_for_status()
-                return await r.json(content_type=None)
+                return await r.json(content_type=None, loads=_json_loads)
 
     async def post_json(
             self,
@@ -72,24 +109,23 @@ class HttpClient:
         - For metacareers, first try without 'br' (they're picky).
         - On 400/403/406/451, retry once with simplified headers and no 'br'.
         """
-        hdrs = dict(_DEFAULT_HEADERS)
-        if headers:
-            hdrs.update(headers)
+        host = _host(url)
 
-        host = urlparse(url).netloc.lower()
-
-        def _no_br(h: Dict[str, str]) -> Dict[str, str]:
-            h2 = dict(h)
-            h2["Accept-Encoding"] = "gzip, deflate"
-            return h2
-
-        # First attempt
-        first_headers = hdrs
-        if "metacareers.com" in host:
+        # First attempt; overlay a fresh dict only when something deviates
+        # from the frozen defaults.
+        if host.endswith("metacareers.com"):
             # Be conservative with encoding for Meta
-            first_headers = _no_br(first_headers)
-            first_headers["Accept"] = "text/html,application/xhtml+xml,*/*;q=0.8"
+            first_headers = {
+                **_DEFAULT_HEADERS,
+                **(headers or {}),
+                "Accept-Encoding": "gzip, deflate",
+                "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+            }
             first_headers.setdefault("Referer", "https://www.metacareers.com/")
+        elif headers:
+            first_headers = {**_DEFAULT_HEADERS, **headers}
+        else:
+            first_headers = _DEFAULT_HEADERS
 
         try:
             async with self.session.get(url, params=params, headers=first_headers) as r:
@@ -98,15 +134,10 @@ class HttpClient:
         except aiohttp.ClientResponseError as e:
             status = getattr(e, "status", 0) or 0
             if status in (400, 403, 406, 451):
-                retry_headers = _no_br({
-                    "User-Agent": USER_AGENT,
-                    "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Cache-Control": "no-cache",
-                    "Pragma": "no-cache",
+                retry_headers = {
+                    **_RETRY_HEADERS_TEMPLATE,
                     "Referer": f"{urlparse(url).scheme}://{host}/",
-                })
+                }
                 async with self.session.get(url, params=params, headers=retry_headers) as r2:
                     r2.raise_for_status()
                     return await r2.text()
@@ -116,7 +147,16 @@ async def get_http() -> HttpClient:
     global _SESSION
     if _SESSION is None or _SESSION.closed:
         ssl_ctx = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_ctx, limit=20, ttl_dns_cache=300)
+        # Keep idle connections warm for 30s so sequential page polls against
+        # the same origin (Workday pagination especially) reuse one TCP/TLS
+        # connection instead of re-handshaking per request. The global limit
+        # leaves room for multi-host crawls; the per-host cap stops one slow
+        # site from monopolizing the pool.
+        connector = aiohttp.TCPConnector(
+            ssl=ssl_ctx, limit=100, limit_per_host=8,
+            ttl_dns_cache=300, keepalive_timeout=30.0,
+            resolver=AsyncResolver() if _AIODNS_OK else None,
+        )
         timeout = aiohttp.ClientTimeout(total=45)
         _SESSION = aiohttp.ClientSession(
             connector=connector,
@@ -1,4 +1,14 @@
-from bs4 import BeautifulSoup
+import soupsieve as sv
+
+from services.scrape.parser import ParsedPage
+
+# Shell detection only needs node counts, body text, and a few selector
+# probes — selectolax (Lexbor) does that without building a bs4 tree.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _LexParser
+    _SELECTOLAX_OK = True
+except Exception:
+    _SELECTOLAX_OK = False
 
 # Optional: extract these to module scope if re-used elsewhere.
 _MOUNT_SELECTORS = [
@@ -10,12 +20,101 @@ _JS_HINT_STRINGS = [
     "needs javascript", "please enable cookies", "disabled scripts"
 ]
 
-def looks_js_shell(html: str) -> bool:
-    if not html:
+# Precompiled for the bs4 fallback: one traversal per combined selector
+# instead of a soupsieve parse/lock per select_one call.
+_SEL_MOUNTS = sv.compile(", ".join(_MOUNT_SELECTORS))
+_SEL_ESRI = sv.compile('.sra.search-results-app, [data-buycard-app="careers"]')
+_SEL_SPINNER = sv.compile(".app-loading-spinner")
+
+def looks_js_shell(page: ParsedPage | str) -> bool:
+    if isinstance(page, str):
+        page = ParsedPage(page)
+    if not page.raw_html:
+        return True
+
+    # Raw-string checks classify the easy cases without any parse: tiny
+    # script-heavy shells, the Esri careers container, and big documents
+    # with many articles (clearly server-rendered).
+    html = page.raw_html
+    if len(html) < 2048 and html.count("<script") >= 3:
+        return True
+    if 'data-buycard-app="careers"' in html:
         return True
+    if len(html) > 200_000 and html.count("<article") > 10:
+        return False
+
+    if _SELECTOLAX_OK:
+        return _looks_js_shell_lexbor(page.raw_html)
+    # bs4 fallback reuses (or primes) the page's shared soup, so the
+    # extractor pipeline doesn't parse the same HTML a second time.
+    return _looks_js_shell_soup(page.soup)
+
+
+# Attribute-level equivalents of _MOUNT_SELECTORS for the fused traversal.
+_MOUNT_IDS = {"__next", "root", "app"}
+_MOUNT_ATTRS = ("data-reactroot", "ng-app", "data-buycard-app")
+
+
+def _looks_js_shell_lexbor(html: str) -> bool:
+    tree = _LexParser(html)
+    root = tree.root
+    if root is None:
+        return True
+
+    # One traversal collects every per-node signal (counts, mount points,
+    # Esri shell, spinner) instead of eight independent selector scans.
+    real_nodes = 0
+    scripts = 0
+    has_mount = False
+    esri_shell = False
+    spinner = False
+    main_node = None
+
+    for node in root.traverse():
+        tag = node.tag
+        if not tag or tag[0] in "-!":  # text/comment pseudo-nodes
+            continue
+        if tag == "script":
+            scripts += 1
+            continue
+        if tag == "style":
+            continue
+        real_nodes += 1
+        if main_node is None and tag == "main":
+            main_node = node
+
+        attrs = node.attributes
+        if not attrs:
+            continue
+        if not has_mount and (
+            attrs.get("id") in _MOUNT_IDS or any(a in attrs for a in _MOUNT_ATTRS)
+        ):
+            has_mount = True
+        if attrs.get("data-buycard-app") == "careers":
+            esri_shell = True
+        cls = attrs.get("class") or ""
+        if cls:
+            classes = cls.split()
+            if "search-results-app" in classes:
+                has_mount = True
+                if "sra" in classes:
+                    esri_shell = True
+            if "app-loading-spinner" in classes:
+                spinner = True
+
+    body = tree.body
+    body_text = (body.text(separator=" ") if body else "").lower()
+    hints = any(h in body_text for h in _JS_HINT_STRINGS)
+
+    # “Heavy DOM, low text” — many elements but very little meaningful text in main content.
+    main_text = main_node.text(separator=" ") if main_node else body_text
+    text_len = len(" ".join(main_text.split()))
+    low_content = (real_nodes > 200 and text_len < 800 and scripts >= 3)
+
+    return ((real_nodes < 15 and scripts >= 3) or hints or has_mount or low_content or esri_shell or spinner)
 
-    soup = BeautifulSoup(html, "html.parser")
 
+def _looks_js_shell_soup(soup) -> bool:
     # Original signal
     real_nodes = len(soup.find_all(lambda t: t.name not in {"script", "style"}))
     scripts = len(soup.find_all("script"))
@@ -23,7 +122,7 @@ def looks_js_shell(html: str) -> bool:
     hints = any(h in body_text for h in _JS_HINT_STRINGS)
 
     # New: common SPA mount points present?
-    has_mount = any(soup.select_one(sel) for sel in _MOUNT_SELECTORS)
+    has_mount = _SEL_MOUNTS.select_one(soup) is not None
 
     # New: “heavy DOM, low text” — many elements but very little meaningful text in main content.
     main = soup.main or soup.body
@@ -31,11 +130,9 @@ def looks_js_shell(html: str) -> bool:
     low_content = (real_nodes > 200 and text_len < 800 and scripts >= 3)
 
     # New: Esri careers job-search shell is an empty app container that JS fills.
-    esri_shell = bool(soup.select_one(".sra.search-results-app")) or bool(
-        soup.select_one('[data-buycard-app="careers"]')
-    )
+    esri_shell = _SEL_ESRI.select_one(soup) is not None
 
-    spinner = bool(soup.select_one(".app-loading-spinner"))
+    spinner = _SEL_SPINNER.select_one(soup) is not None
 
     # Keep the original small-DOM rule, add new triggers.
     return ((real_nodes < 15 and scripts >= 3) or hints or has_mount or low_content or esri_shell or spinner)
@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 from urllib.parse import urlparse
 
+# Memoized urlparse shared with the other URL helpers; see url.py.
+_parse = lru_cache(maxsize=4096)(urlparse)
+
 # Segments that strongly indicate a non-detail page.
 BAD_PATH_SEGMENTS = {
     "saved", "alerts", "recommendations", "dashboard", "signin", "sign-in",
@@ -26,9 +30,14 @@ ATS_HOST_PATTERNS = [
     re.compile(r"(?:^|\.)(?:[a-z0-9-]+\.wd\d+\.)?myworkdayjobs\.com$", re.I),
 ]
 
+# Folded alternation: one engine invocation per host instead of one per
+# pattern. The individual patterns above stay as the readable source of
+# truth (none of them use named groups, so joining is safe).
+_ATS_HOST_RE = re.compile("|".join(f"(?:{p.pattern})" for p in ATS_HOST_PATTERNS), re.I)
+
 
 def _host_matches_ats(host: str) -> bool:
-    return any(p.search(host) for p in ATS_HOST_PATTERNS)
+    return _ATS_HOST_RE.search(host) is not None
 
 
 # URL path shapes for actual job detail pages.
@@ -56,14 +65,25 @@ JOB_DETAIL_PATTERNS = [
     re.compile(r"(^|/)(?:[a-z]{2}(?:-[a-z]{2})?/)?job/[\w-]{6,}(?:/|$)", re.I),
 ]
 
+# Same folding for the detail patterns; see _ATS_HOST_RE above.
+_JOB_DETAIL_RE = re.compile("|".join(f"(?:{p.pattern})" for p in JOB_DETAIL_PATTERNS), re.I)
+
+# Literal prefilter: every JOB_DETAIL_PATTERNS entry requires one of these
+# substrings, so paths containing none of them skip the regex loop entirely.
+# str.__contains__ is a single C-level scan per literal — the multi-pattern
+# prefiltering idea without a native matcher dependency.
+_DETAIL_LITERALS = ("job", "career", "position", "vacanc", "details", "apply", "wday")
 
+
+@lru_cache(maxsize=8192)
 def _looks_like_job_detail_url(url: str) -> bool:
     """
     Heuristic: does this absolute URL look like a job *detail* page?
     We err on the conservative side to avoid listing category pages.
+    Pure per URL and re-run by each extractor stage, so memoized.
     """
     try:
-        parsed = urlparse(url)
+        parsed = _parse(url)
     except Exception:
         return False
     if not (parsed.scheme in ("http", "https") and parsed.netloc):
@@ -73,9 +93,11 @@ def _looks_like_job_detail_url(url: str) -> bool:
     if not path.startswith("/"):
         path = "/" + path
 
-    # Known slug/ID patterns
-    if any(p.search(path) for p in JOB_DETAIL_PATTERNS):
-        return True
+    # Known slug/ID patterns, behind the cheap literal gate
+    path_l = path.lower()
+    if any(lit in path_l for lit in _DETAIL_LITERALS):
+        if _JOB_DETAIL_RE.search(path):
+            return True
 
     # ATS hosts commonly use /<org>/<uuid> or numeric ID as the leaf
     if _host_matches_ats(parsed.netloc):
@@ -138,15 +160,17 @@ def _title_from_attrs(node) -> str:
     return ""
 
 
-_GENERIC_CLASS_TOKENS = {"row", "rows", "col", "cols", "container", "grid", "section", "wrapper", "content"}
+_GENERIC_CLASS_TOKENS = frozenset(
+    {"row", "rows", "col", "cols", "container", "grid", "section", "wrapper", "content"}
+)
 
 
-def _is_generic_classkey(class_key: str) -> bool:
-    toks = set(class_key.split())
-    return bool(toks & _GENERIC_CLASS_TOKENS) or not class_key
+def _is_generic_classkey(classes: FrozenSet[str]) -> bool:
+    # Class lists are kept as frozensets so this is a hash lookup, not a
+    # sorted-join plus substring scan per child.
+    return not classes or not classes.isdisjoint(_GENERIC_CLASS_TOKENS)
 
 
-def _selector_from_key(key: Tuple[str, str]) -> str:
-    tag, class_key = key
-    classes = [c for c in class_key.split() if c]
-    return f"{tag}{''.join('.' + c for c in classes)}"
+def _selector_from_key(key: Tuple[str, FrozenSet[str]]) -> str:
+    tag, classes = key
+    return f"{tag}{''.join('.' + c for c in sorted(classes))}"
@@ -4,8 +4,27 @@ from __future__ import annotations
 import re
 from urllib.parse import urlparse, parse_qsl, urlunparse, urlencode
 
+import soupsieve as sv
+
 from services.scrape.url import _absolute
 
+# Compiled once at import; soup.select_one(str) re-resolves the selector
+# through soupsieve's lock-guarded cache on every call.
+_SEL_PAGE_INPUT = sv.compile('input[data-autom="paginationPageInput"], input.rc-pagination-pageinput')
+_SEL_TOTAL_PAGES = sv.compile(".rc-pagination-total-pages")
+_SEL_REL_NEXT = sv.compile('a[rel*="next" i]')
+_SEL_ARIA_ANCHORS = sv.compile("a[aria-label]")
+_SEL_BTN_NEXT = sv.compile(
+    '[data-analytics-pagination="next"] a[href], '
+    '.VfPpkd-wZVHld-gruSEe a[href][aria-label*="next" i]'
+)
+_SEL_PAGER_NAV = sv.compile('nav[aria-label*="pagination" i]')
+_SEL_NAV_NEXT = sv.compile('a[href][rel*="next" i], a[href][aria-label*="next" i]')
+_SEL_PAGER_ANCHORS = sv.compile(
+    'nav[aria-label*="pagination" i] a[aria-label], '
+    "ul.pagination a[aria-label], .pagination a[aria-label]"
+)
+
 _NEXT_LABELS = ("next", "go to next page", "weiter", "suivant", "siguiente")
 
 # Some sites use alternatives to `page`
@@ -26,24 +45,26 @@ def _get_int_text(el) -> int | None:
     return int(s) if s.isdigit() else None
 
 
+_RANGE_RE = re.compile(r"(\d+)\s*[\u2010\u2011\u2012\u2013\-]\s*(\d+)\s*of\s*(\d+)", re.I)
+
+
 def _parse_results_window(soup) -> tuple[int | None, int | None]:
     """
     Parse '1-20 of 25' → (pagesize=20, total=25). Works for a few UIs.
     """
-    text_nodes = soup.find_all(string=True)
-    for t in text_nodes:
-        s = " ".join(str(t).split())
-        m = re.search(r"(\d+)\s*[\u2010\u2011\u2012\u2013\-]\s*(\d+)\s*of\s*(\d+)", s, flags=re.I)
-        if m:
-            start, end, total = map(int, m.groups())
-            pagesize = end - start + 1 if end >= start else None
-            return pagesize, total
+    # One regex pass over the flattened document text instead of a per-text-
+    # node walk that allocates and scans each node separately.
+    m = _RANGE_RE.search(soup.get_text(" "))
+    if m:
+        start, end, total = map(int, m.groups())
+        pagesize = end - start + 1 if end >= start else None
+        return pagesize, total
     return None, None
 
 
 def _current_page_from_dom(soup) -> int | None:
     # Apple: <input data-autom="paginationPageInput" value="1">
-    inp = soup.select_one('input[data-autom="paginationPageInput"], input.rc-pagination-pageinput')
+    inp = _SEL_PAGE_INPUT.select_one(soup)
     if inp and inp.has_attr("value"):
         try:
             return int(inp["value"])
@@ -59,7 +80,7 @@ def _current_page_from_dom(soup) -> int | None:
 
 def _total_pages_from_dom(soup) -> int | None:
     # Apple: <span class="rc-pagination-total-pages">5</span>
-    total = _get_int_text(soup.select_one(".rc-pagination-total-pages"))
+    total = _get_int_text(_SEL_TOTAL_PAGES.select_one(soup))
     return total
 
 
@@ -68,12 +89,12 @@ def _find_next_href_direct(soup, current_page: int | None = None) -> str | None:
     Try to find an explicit 'next' link in the DOM (anchor or button-wrapped anchor).
     """
     # 1) rel=next
-    a = soup.select_one('a[rel*="next" i]')
+    a = _SEL_REL_NEXT.select_one(soup)
     if a and a.has_attr("href"):
         return a["href"]
 
     # 2) anchors with aria-label mentioning "next" and not disabled
-    for a in soup.select('a[aria-label]'):
+    for a in _SEL_ARIA_ANCHORS.iselect(soup):
         label = a.get("aria-label", "").lower()
         if re.search(r"\b(next|go to next page|weiter|suivant|siguiente)\b", label, flags=re.I):
             if a.get("aria-disabled", "").lower() in {"true", "1"}:
@@ -83,24 +104,21 @@ def _find_next_href_direct(soup, current_page: int | None = None) -> str | None:
             return a["href"]
 
     # 3) known button-wrapped anchor (Google-like)
-    btn_next = soup.select_one(
-        '[data-analytics-pagination="next"] a[href], '
-        '.VfPpkd-wZVHld-gruSEe a[href][aria-label*="next" i]'
-    )
+    btn_next = _SEL_BTN_NEXT.select_one(soup)
     if btn_next:
         return btn_next.get("href")
 
     # 4) generic pager nav
-    nav = soup.select_one('nav[aria-label*="pagination" i]')
+    nav = _SEL_PAGER_NAV.select_one(soup)
     if nav:
-        cand = nav.select_one('a[href][rel*="next" i], a[href][aria-label*="next" i]')
+        cand = _SEL_NAV_NEXT.select_one(nav)
         if cand:
             return cand["href"]
 
     # 5) last-resort: look for anchors with ?page=K (or variants) > current
     keys = ("page",) + _ALT_PAGE_KEYS
     candidates: list[tuple[int, str]] = []
-    for a in soup.select('nav[aria-label*="pagination" i] a[aria-label], ul.pagination a[aria-label], .pagination a[aria-label]'):
+    for a in _SEL_PAGER_ANCHORS.iselect(soup):
         href = a.get("href", "")
         for key in keys:
             m = re.search(rf"[?&]{re.escape(key)}=(\d+)\b", href)
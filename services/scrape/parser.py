@@ -0,0 +1,75 @@
+# services/scrape/parser.py
+from __future__ import annotations
+
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+# Prefer the C-based lxml backend (5-10x faster tree builds on big listing
+# pages, lower memory); fall back to the stdlib parser if lxml is missing.
+try:
+    import lxml  # noqa: F401
+    _PARSER = "lxml"
+except Exception:
+    _PARSER = "html.parser"
+
+# Optional: selectolax (Lexbor bindings) for pages parsed only to pluck a
+# single node — it skips building a full bs4 tree entirely.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _LexParser
+    _SELECTOLAX_OK = True
+except Exception:
+    _SELECTOLAX_OK = False
+
+
+def make_soup(html_text: str) -> BeautifulSoup:
+    """Parse HTML with the fastest available BeautifulSoup backend."""
+    return BeautifulSoup(html_text, _PARSER)
+
+
+class ParsedPage:
+    """
+    One fetched document plus lazily built parser state. JS-shell detection,
+    extraction, and pagination all look at the same page, so sharing this
+    object parses the HTML at most once per page.
+    """
+    __slots__ = ("raw_html", "_soup", "_text")
+
+    def __init__(self, raw_html: str):
+        self.raw_html = raw_html
+        self._soup: Optional[BeautifulSoup] = None
+        self._text: Optional[str] = None
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        if self._soup is None:
+            self._soup = make_soup(self.raw_html)
+        return self._soup
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.soup.get_text(" ")
+        return self._text
+
+
+def first_h1_text(html_text: str) -> Optional[str]:
+    """
+    Text of the document's first <h1>, or None.
+
+    Detail pages are parsed for exactly this one node, so use selectolax
+    when available and only fall back to a full soup build.
+    """
+    if not html_text:
+        return None
+    if _SELECTOLAX_OK:
+        node = _LexParser(html_text).css_first("h1")
+        if node is None:
+            return None
+        t = " ".join(node.text(separator=" ").split())
+        return t or None
+    h1 = make_soup(html_text).find("h1")
+    if not h1:
+        return None
+    t = h1.get_text(" ", strip=True)
+    return t or None
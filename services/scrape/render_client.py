@@ -1,15 +1,32 @@
 # services/scrape/render_client.py
 import asyncio
-from typing import Optional
+from typing import List, Optional
+
+from cachetools import TTLCache
 from playwright.async_api import async_playwright
 
 _pw = None
 _browser = None
 _lock = asyncio.Lock()
 
+# Short-lived cache of rendered pages keyed on (url, wait_for, user_agent).
+# Retries and overlapping site configs within one worker pass re-request the
+# same listing URLs; serving those from memory skips a full browser render.
+_RENDER_CACHE: TTLCache = TTLCache(maxsize=128, ttl=120.0)
+_render_cache_lock = asyncio.Lock()
+
 async def _ensure_browser():
     global _pw, _browser
     async with _lock:
+        if _browser is not None and not _browser.is_connected():
+            # Chromium crashed or was killed; restart the stack rather than
+            # handing out a dead browser forever.
+            try:
+                await _pw.stop()
+            except Exception:
+                pass
+            _pw = None
+            _browser = None
         if _browser is None:
             _pw = await async_playwright().start()
             # chromium is broadly compatible; you can switch to firefox/webkit if needed
@@ -19,29 +36,116 @@ async def _ensure_browser():
             )
     return _browser
 
+
+# Nothing here paints pixels, so stylesheets go the same way as images;
+# tracker endpoints only add network and JS work to every page.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+_BLOCKED_URL_HINTS = (
+    "googletagmanager", "doubleclick", "hotjar", "segment", "optimizely", "fullstory",
+)
+
+
+async def _route(route):
+    req = route.request
+    if req.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        h in req.url for h in _BLOCKED_URL_HINTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Warm page pool. Page construction (DOM init, script isolation) is not free,
+# so renders borrow a page from a small per-user-agent pool instead of paying
+# a fresh context + page per URL. user_agent is a context-level setting in
+# Playwright, hence one shared context per distinct user agent.
+_POOL_MAX_PAGES = 8
+_pool_lock = asyncio.Lock()
+_pool_contexts: dict = {}  # user_agent -> BrowserContext
+_page_pools: dict = {}     # user_agent -> asyncio.Queue of idle pages
+_pool_sizes: dict = {}     # user_agent -> pages created so far
+
+
+async def _acquire_page(user_agent: Optional[str]):
+    async with _pool_lock:
+        context = _pool_contexts.get(user_agent)
+        if context is None:
+            browser = await _ensure_browser()
+            context = await browser.new_context(
+                user_agent=user_agent,
+                java_script_enabled=True,
+                locale="en-US",
+                viewport={"width": 1366, "height": 900},
+            )
+            await context.route("**/*", _route)
+            _pool_contexts[user_agent] = context
+            _page_pools[user_agent] = asyncio.Queue()
+            _pool_sizes[user_agent] = 0
+
+        pool = _page_pools[user_agent]
+        if pool.empty() and _pool_sizes[user_agent] < _POOL_MAX_PAGES:
+            _pool_sizes[user_agent] += 1
+            return await context.new_page()
+    return await pool.get()
+
+
+async def _release_page(user_agent: Optional[str], page) -> None:
+    try:
+        # Reset to a blank document so the next borrower never sees stale DOM.
+        await page.goto("about:blank")
+    except Exception:
+        # Page died mid-render; close it (don't leak the Chromium page) and
+        # drop it from the accounting so the pool can grow a fresh one.
+        try:
+            await page.close()
+        except Exception:
+            pass
+        async with _pool_lock:
+            _pool_sizes[user_agent] -= 1
+            # If the whole browser went down, every pooled context and idle
+            # page is dead too; clear them so the next acquire rebuilds
+            # against the restarted browser instead of failing forever.
+            if _browser is not None and not _browser.is_connected():
+                _pool_contexts.clear()
+                _page_pools.clear()
+                _pool_sizes.clear()
+        return
+    await _page_pools[user_agent].put(page)
+
 async def fetch_rendered_html(
     url: str,
     *,
     timeout_ms: int = 30_000,
     wait_for: str = '#job-search-app [role="listitem"], [data-automationid="jobCard"], [data-automation-id="job-card"]',
     user_agent: Optional[str] = None,
+    force: bool = False,
+    content_selector: Optional[str] = None,
 ) -> str:
-    browser = await _ensure_browser()
-    context = await browser.new_context(
-        user_agent=user_agent,
-        java_script_enabled=True,
-        locale="en-US",
-        viewport={"width": 1366, "height": 900},
+    key = (url, wait_for, user_agent, content_selector)
+    if not force:
+        async with _render_cache_lock:
+            cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+    html = await _fetch_rendered_html_uncached(
+        url, timeout_ms=timeout_ms, wait_for=wait_for, user_agent=user_agent,
+        content_selector=content_selector,
     )
-    async def _route(route):
-        # Block only heavy assets
-        if route.request.resource_type in {"image", "media", "font"}:
-            await route.abort()
-        else:
-            await route.continue_()
-    await context.route("**/*", _route)
-
-    page = await context.new_page()
+    async with _render_cache_lock:
+        _RENDER_CACHE[key] = html
+    return html
+
+
+async def _fetch_rendered_html_uncached(
+    url: str,
+    *,
+    timeout_ms: int,
+    wait_for: str,
+    user_agent: Optional[str],
+    content_selector: Optional[str] = None,
+) -> str:
+    page = await _acquire_page(user_agent)
     try:
         await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
 
@@ -67,6 +171,70 @@ async def fetch_rendered_html(
         except Exception:
             # One more chance: the app sometimes renders late
             await page.wait_for_load_state("networkidle")
-        return await page.content()
+        return await _page_html(page, content_selector)
+    finally:
+        await _release_page(user_agent, page)
+
+
+async def _page_html(page, content_selector: Optional[str]) -> str:
+    """
+    Serialize the rendered page. With a content_selector, only the matching
+    nodes' outerHTML crosses the CDP wire — page.content() marshals the whole
+    megabyte-scale DOM, which is waste when the caller wants one element.
+    """
+    if content_selector:
+        return await page.eval_on_selector_all(
+            content_selector, "els => els.map(e => e.outerHTML).join('')"
+        )
+    return await page.content()
+
+
+async def fetch_rendered_html_many(
+    urls: List[str],
+    *,
+    timeout_ms: int = 30_000,
+    wait_for: str = "h1",
+    user_agent: Optional[str] = None,
+    content_selector: Optional[str] = None,
+) -> List[str]:
+    """
+    Render several URLs through ONE browser context and ONE page, navigating
+    in sequence. Compared to calling fetch_rendered_html per URL, this shares
+    TLS sessions, the browser heap, and the JS runtime across the whole batch.
+
+    Returns HTML strings aligned with `urls`. A failed navigation raises and
+    fails the whole batch: callers feed the result into apply_scrape, which
+    treats a missing job as confirmed-gone, so a partial batch would flip
+    live postings to inactive on a transient render error.
+    """
+    if not urls:
+        return []
+
+    # Serve what the TTL cache already has and only navigate to the rest, so
+    # a retried batch doesn't redo identical Chromium work.
+    out: List[Optional[str]] = [None] * len(urls)
+    async with _render_cache_lock:
+        for i, url in enumerate(urls):
+            out[i] = _RENDER_CACHE.get((url, wait_for, user_agent, content_selector))
+    pending = [i for i, html in enumerate(out) if html is None]
+    if not pending:
+        return out  # type: ignore[return-value]
+
+    page = await _acquire_page(user_agent)
+    try:
+        for i in pending:
+            url = urls[i]
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+            try:
+                await page.wait_for_selector(wait_for, timeout=timeout_ms)
+            except Exception:
+                # The app sometimes renders late; take what we have.
+                pass
+            out[i] = await _page_html(page, content_selector)
+        async with _render_cache_lock:
+            for i in pending:
+                if out[i]:
+                    _RENDER_CACHE[(urls[i], wait_for, user_agent, content_selector)] = out[i]
+        return out  # type: ignore[return-value]
     finally:
-        await context.close()
\ No newline at end of file
+        await _release_page(user_agent, page)
\ No newline at end of file
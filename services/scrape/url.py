@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse, parse_qsl, urlunparse, urlencode, parse_qs, quote
 
 USER_AGENT = (
@@ -10,10 +11,17 @@ USER_AGENT = (
     "Chrome/124.0 Safari/537.36"
 )
 
+# Each anchor is parsed by several helpers in turn; ParseResult is immutable,
+# so one memoized urlparse per distinct string serves them all.
+_parse = lru_cache(maxsize=4096)(urlparse)
 
+
+@lru_cache(maxsize=8192)
 def _absolute(url: str, base: str) -> str:
     """
     Resolve possibly-relative `url` against `base` and return an absolute URL.
+    Every extractor stage resolves the same (href, base) pairs, so the
+    result is memoized on that tuple.
     """
     return urljoin(base, url)
 
@@ -22,46 +30,89 @@ def _is_http_url(href: str | None) -> bool:
     if not href or href.startswith(("mailto:", "tel:", "javascript:")):
         return False
     try:
-        parsed = urlparse(href)
+        parsed = _parse(href)
     except Exception:
         return False
     return parsed.scheme in ("http", "https") or (not parsed.scheme and bool(parsed.path))
 
 
-# Params that must NOT affect job identity
-_JOB_IGNORE_PARAMS = {
+# Params that must NOT affect job identity (all lowercase)
+_JOB_IGNORE_PARAMS = frozenset({
     "page", "start", "offset",              # pagination
     "ref", "referral", "src", "source",     # refs
     "gh_src", "gh_jid",                     # Greenhouse
     "_gl", "_ga", "_gac",                   # GA
     "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
-    "locations", "location", "locationHierarchy1", "locationHierarchy2",
-    "locationCity", "locationState", "lat", "lng",
-}
+    "locations", "location", "locationhierarchy1", "locationhierarchy2",
+    "locationcity", "locationstate", "lat", "lng",
+})
+
+
+# Detect the conditions that force the full parse/rebuild cycle below.
+_DUP_RESULTS_RE = re.compile(r"/jobs/results/jobs/results/")
+_HAS_IGNORE_PARAM_RE = re.compile(
+    r"[?&](?:" + "|".join(re.escape(p) for p in sorted(_JOB_IGNORE_PARAMS)) + r")=", re.I
+)
 
 
+@lru_cache(maxsize=8192)
 def canonical_job_url(url: str) -> str:
     """
     Canonicalize a job detail URL:
       - Collapse accidental repeated segments like /jobs/results/jobs/results/
       - Drop volatile params (utm, gh_src, pagination, etc.)
       - Keep ordering of remaining params stable
-    """
-    p = urlparse(url)
-    path = re.sub(r"/(jobs/results)(?:/\1)+", r"/\1", p.path)
 
-    q = [(k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
-         if k.lower() not in _JOB_IGNORE_PARAMS]
-    q.sort()
-    return urlunparse((p.scheme, p.netloc, path, p.params, urlencode(q, doseq=True), p.fragment))
+    Deterministic per input and called once per job by every adapter plus the
+    generic flow, so results are memoized for the lifetime of the process.
+    """
+    # Fast path: most already-canonical URLs have no duplicated segment and
+    # either no query or a single clean param, so the parse/sort/rebuild
+    # chain would return them unchanged.
+    if not _DUP_RESULTS_RE.search(url):
+        if "?" not in url:
+            return url
+        if (
+            not _HAS_IGNORE_PARAM_RE.search(url)
+            and "&" not in url
+            and "%" not in url
+            and "+" not in url
+        ):
+            return url
+
+    p = _parse(url)
+    # Substring test first: the duplicated segment is rare, and
+    # str.__contains__ is far cheaper than spinning up the regex engine.
+    if "/jobs/results/jobs/results" in p.path:
+        path = re.sub(r"/(jobs/results)(?:/\1)+", r"/\1", p.path)
+    else:
+        path = p.path
+
+    # Membership first (keys are almost always lowercase already); .lower()
+    # only runs for keys that miss and contain uppercase.
+    pairs = parse_qsl(p.query, keep_blank_values=True)
+    q = [
+        (k, v) for k, v in pairs
+        if k not in _JOB_IGNORE_PARAMS
+        and (k.islower() or k.lower() not in _JOB_IGNORE_PARAMS)
+    ]
+    if len(q) == len(pairs) and q == sorted(q):
+        # Nothing dropped and already ordered — keep the original encoding.
+        query = p.query
+    else:
+        q.sort()
+        query = urlencode(q, doseq=True)
+    return urlunparse((p.scheme, p.netloc, path, p.params, query, p.fragment))
 
 
 _PAGE_ONE_KEYS = {"page", "pg", "p", "pageNumber"}
 _ZERO_OFFSET_KEYS = {"start", "offset", "from", "startrow"}
 
 
+@lru_cache(maxsize=8192)
 def normalize_page_identity(url: str) -> str:
-    p = urlparse(url)
+    # Deterministic per URL; pagination revisits the same nav/footer links.
+    p = _parse(url)
     q = parse_qs(p.query, keep_blank_values=True)  # preserves multi-values
 
     # Drop page=1 / pg=1, etc.
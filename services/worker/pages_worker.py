@@ -1,17 +1,29 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
+import heapq
 import random
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
 from time import perf_counter
-from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+from typing import Optional, Tuple
 
-from data.model import Job, JobBoard, load_pages
+from data.model import JobBoard, load_pages_cached
 from services.scrape import scrape_jobs_with_meta  # works whether sync or async
 
+# libuv event loop: lower per-task/callback overhead when many fetches are
+# in flight. Optional (no wheels on Windows); asyncio default otherwise.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+
+_NS = 1_000_000_000  # nanoseconds per second
+
 
 @dataclass(frozen=True)
 class WorkerConfig:
@@ -31,45 +43,75 @@ class WorkerConfig:
     # optional: run a single pass and exit
     once: bool = False
 
+    # Integer-nanosecond forms of the cadence fields, derived once so the
+    # per-page scheduling math stays in plain ints instead of building
+    # timedeltas on every call.
+    @cached_property
+    def base_frequency_ns(self) -> int:
+        return int(self.base_frequency.total_seconds() * _NS)
+
+    @cached_property
+    def jitter_ns(self) -> int:
+        return int(self.jitter.total_seconds() * _NS)
+
+    @cached_property
+    def min_delay_ns(self) -> int:
+        return int(self.min_delay.total_seconds() * _NS)
+
+    @cached_property
+    def error_backoff_ns(self) -> int:
+        return int(self.error_backoff.total_seconds() * _NS)
+
+    @cached_property
+    def error_jitter_ns(self) -> int:
+        return int(self.error_jitter.total_seconds() * _NS)
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def _rand_seconds(span: timedelta) -> float:
-    return random.uniform(-span.total_seconds(), span.total_seconds())
+def _rand_ns(span_ns: int) -> int:
+    """Uniform int in [-span_ns, +span_ns]."""
+    if span_ns <= 0:
+        return 0
+    return random.getrandbits(63) % (2 * span_ns + 1) - span_ns
 
 
 def compute_next_scrape_at(
     *,
     last_scraped: Optional[datetime],
     now: Optional[datetime] = None,
-    base: timedelta,
-    jitter: timedelta,
-    min_delay: timedelta,
+    base_ns: int,
+    jitter_ns: int,
+    min_delay_ns: int,
 ) -> datetime:
     """
-    next = (last_scraped or now) + base + U[-jitter,+jitter], but never earlier than now + min_delay
+    next = (last_scraped or now) + base + U[-jitter,+jitter], but never earlier
+    than now + min_delay. All intermediate math is int64 nanoseconds; a
+    datetime is built only for the returned value.
     """
-    t0 = last_scraped or (now or _now_utc())
     current = now or _now_utc()
-    candidate = t0 + base + timedelta(seconds=_rand_seconds(jitter))
+    current_ns = int(current.timestamp() * _NS)
+    t0_ns = int(last_scraped.timestamp() * _NS) if last_scraped else current_ns
+    candidate_ns = t0_ns + base_ns + _rand_ns(jitter_ns)
 
-    floor = current + min_delay
-    if candidate < floor:
+    floor_ns = current_ns + min_delay_ns
+    if candidate_ns < floor_ns:
         # keep a little randomness so workers don't align perfectly
-        candidate = floor + timedelta(seconds=random.uniform(0, 30))
-    return candidate
+        candidate_ns = floor_ns + _rand_ns(15 * _NS) + 15 * _NS  # U[0, 30s]
+    return datetime.fromtimestamp(candidate_ns / _NS, tz=timezone.utc)
 
 
-async def _maybe_async_call(fn: Callable[..., List[Job] | Awaitable[List[Job]]], *args, **kwargs) -> List[Job]:
-    """
-    Call scrape_jobs whether it's sync or async.
-    """
-    result = fn(*args, **kwargs)
-    if inspect.isawaitable(result):
-        return await result  # type: ignore[return-value]
-    return result  # type: ignore[return-value]
+# scrape_jobs_with_meta's shape doesn't change at runtime, so resolve the
+# sync/async dispatch once at import instead of introspecting every result on
+# the hot scrape path. A sync implementation runs via to_thread, which also
+# keeps the event loop free for concurrent scrapes.
+if asyncio.iscoroutinefunction(scrape_jobs_with_meta):
+    _scrape_call = scrape_jobs_with_meta
+else:
+    def _scrape_call(*args, **kwargs):
+        return asyncio.to_thread(scrape_jobs_with_meta, *args, **kwargs)
 
 
 async def _scrape_one(
@@ -88,7 +130,7 @@ async def _scrape_one(
     t0 = perf_counter()
 
     try:
-        jobs, meta = await _maybe_async_call(scrape_jobs_with_meta, str(jb.website_url))
+        jobs, meta = await _scrape_call(str(jb.website_url))
         num = len(jobs)
 
         print(f"scraped {jb.title}: {num} jobs")
@@ -105,9 +147,9 @@ async def _scrape_one(
         jb.next_scrape_at = compute_next_scrape_at(
             last_scraped=jb.last_scraped,
             now=now,
-            base=cfg.base_frequency,
-            jitter=cfg.jitter,
-            min_delay=cfg.min_delay,
+            base_ns=cfg.base_frequency_ns,
+            jitter_ns=cfg.jitter_ns,
+            min_delay_ns=cfg.min_delay_ns,
         )
 
     except Exception as e:
@@ -127,74 +169,141 @@ async def _scrape_one(
         jb.next_scrape_at = compute_next_scrape_at(
             last_scraped=now,
             now=now,
-            base=cfg.error_backoff,
-            jitter=cfg.error_jitter,
-            min_delay=cfg.min_delay,
+            base_ns=cfg.error_backoff_ns,
+            jitter_ns=cfg.error_jitter_ns,
+            min_delay_ns=cfg.min_delay_ns,
         )
 
     return jf, jb, err, num
 
 
-def _due_pages(items: Iterable[Tuple[Path, JobBoard]], now: datetime) -> list[Tuple[Path, JobBoard]]:
-    due: list[Tuple[Path, JobBoard]] = []
-    for jf, jb in items:
-        nsa = jb.next_scrape_at
-        if nsa is None or nsa <= now:
-            due.append((jf, jb))
-    return due
-
-
 async def run_pages_worker(cfg: WorkerConfig) -> None:
     """
-    Main loop. Loads pages, scrapes due ones with concurrency, writes results,
-    updates next_scrape_at, repeats.
+    Main loop. Feeds due pages into a queue consumed by long-lived worker
+    coroutines, which scrape, persist, and update next_scrape_at. The feeder
+    dispatches items as soon as they're due, so a slow scrape occupies only
+    its own worker instead of pinning a whole batch behind the straggler.
     """
     # pre-load to validate the folder exists even if empty
     cfg.pages_dir.mkdir(parents=True, exist_ok=True)
 
-    sem = asyncio.Semaphore(cfg.concurrency)
+    queue: asyncio.Queue[Tuple[Path, JobBoard]] = asyncio.Queue()
+    in_flight: set[Path] = set()  # queued or actively scraping
+
+    # Min-heap of (due_ns, path) with lazy invalidation: `sched` holds the
+    # currently valid due time per path, and heap entries that disagree are
+    # skipped on pop. Finding what's due is O(log N) pops instead of an
+    # O(N) datetime scan per wakeup, and the heap top doubles as the exact
+    # sleep target.
+    heap: list[Tuple[int, str]] = []
+    sched: dict[str, int] = {}
+
+    async def _worker():
+        while True:
+            jf, jb = await queue.get()
+            now = _now_utc()
+            try:
+                print(f"[{now.isoformat()}] scraping {jb.title}")
+                path, updated, err, n = await _scrape_one(jf, jb, cfg, now=now)
+                if err:
+                    print(f"[{now.isoformat()}] ERROR scraping {updated.title}: {err!r}")
+                else:
+                    print(f"[{now.isoformat()}] scraped {updated.title}: {n} jobs")
+
+                if not cfg.dry_run:
+                    # persist off the event loop so disk I/O doesn't stall scrapes
+                    await asyncio.to_thread(updated.to_file, path)
+                else:
+                    print(f"[dry-run] would write {path}")
+                    # Nothing was written, so the on-disk due time won't
+                    # change; drop the sched entry so the feeder re-pushes
+                    # the board instead of starving it forever.
+                    sched.pop(str(jf), None)
+            except Exception as e:
+                # Keep the worker alive. Invalidate the sched entry too:
+                # the file kept its old next_scrape_at, and without this the
+                # feeder would never push another heap entry for the board.
+                print(f"[{now.isoformat()}] ERROR persisting {jb.title}: {e!r}")
+                sched.pop(str(jf), None)
+            finally:
+                in_flight.discard(jf)
+                queue.task_done()
+
+    workers = [asyncio.create_task(_worker()) for _ in range(cfg.concurrency)]
+
+    # Upper bound on one nap. Sleeping until the next due time (instead of a
+    # fixed 1s poll) avoids thousands of no-op wakeups/hour; the cap keeps the
+    # worker responsive to page files added from outside the loop.
+    max_sleep_s = 60.0
 
-    async def _task(jf: Path, jb: JobBoard, now: datetime):
-        async with sem:
-            print(f"[{now.isoformat()}] scraping {jb.title}")
-            path, updated, err, n = await _scrape_one(jf, jb, cfg, now=now)
-            if err:
-                print(f"[{now.isoformat()}] ERROR scraping {updated.title}: {err!r}")
-            else:
-                print(f"[{now.isoformat()}] scraped {updated.title}: {n} jobs")
+    try:
+        while True:
+            now = _now_utc()
+            # copy=True: apply_scrape mutates the board, and the UI threads
+            # iterate the cached instances concurrently.
+            pages: list[Tuple[Path, JobBoard]] = load_pages_cached(cfg.pages_dir, copy=True)
+            if not pages:
+                # nothing to do — nap until the next rescan
+                if cfg.once:
+                    return
+                await asyncio.sleep(max_sleep_s)
+                continue
+
+            # ensure first-time pages run now (with tiny jitter), not in +1h
+            for _, jb in pages:
+                if jb.next_scrape_at is None and jb.last_scraped is None:
+                    jb.next_scrape_at = compute_next_scrape_at(
+                        last_scraped=None,
+                        now=now,
+                        base_ns=0,  # <-- first run: no base delay
+                        jitter_ns=0,
+                        min_delay_ns=0,  # allow "now"
+                    )
+
+            # Sync the heap with the loaded state: push only boards whose due
+            # time changed (first sight, or rescheduled after a scrape).
+            now_ns = int(now.timestamp() * _NS)
+            by_path = {str(jf): (jf, jb) for jf, jb in pages}
+            for jf, jb in pages:
+                key = str(jf)
+                due_ns = (
+                    int(jb.next_scrape_at.timestamp() * _NS)
+                    if jb.next_scrape_at is not None
+                    else now_ns
+                )
+                if sched.get(key) != due_ns:
+                    sched[key] = due_ns
+                    heapq.heappush(heap, (due_ns, key))
+            # Deleted page files: drop their sched entries; stale heap entries
+            # fall out lazily below.
+            for key in [k for k in sched if k not in by_path]:
+                del sched[key]
+
+            # Dispatch everything due; a dispatched board gets a fresh heap
+            # entry once its scrape reschedules next_scrape_at.
+            while heap and heap[0][0] <= now_ns:
+                due_ns, key = heapq.heappop(heap)
+                if sched.get(key) != due_ns:
+                    continue  # superseded or deleted
+                jf, jb = by_path[key]
+                if jf not in in_flight:
+                    in_flight.add(jf)
+                    queue.put_nowait((jf, jb))
 
-            if not cfg.dry_run:
-                # persist
-                updated.to_file(path)
-            else:
-                print(f"[dry-run] would write {path}")
-
-    while True:
-        now = _now_utc()
-        pages: list[Tuple[Path, JobBoard]] = load_pages(cfg.pages_dir)
-        if not pages:
-            # nothing to do — nap a bit
-            await asyncio.sleep(1.0)
             if cfg.once:
+                await queue.join()
                 return
-            continue
-
-        # ensure first-time pages run now (with tiny jitter), not in +1h
-        for _, jb in pages:
-            if jb.next_scrape_at is None and jb.last_scraped is None:
-                jb.next_scrape_at = compute_next_scrape_at(
-                    last_scraped=None,
-                    now=now,
-                    base=timedelta(0),  # <-- first run: no base delay
-                    jitter=timedelta(0),
-                    min_delay=timedelta(0),  # allow "now"
-                )
 
-        due = _due_pages(pages, now)
-        if due:
-            tasks = [asyncio.create_task(_task(jf, jb, now)) for jf, jb in due[: cfg.concurrency * 2]]
-            await asyncio.gather(*tasks)
-
-        if cfg.once:
-            return
-        await asyncio.sleep(1.0)
\ No newline at end of file
+            # Sleep until the heap top (skipping invalidated entries),
+            # clamped to [0, max_sleep_s].
+            while heap and sched.get(heap[0][1]) != heap[0][0]:
+                heapq.heappop(heap)
+            if heap:
+                delay = heap[0][0] / _NS - _now_utc().timestamp()
+            else:
+                delay = max_sleep_s
+            await asyncio.sleep(min(max(delay, 0.0), max_sleep_s))
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
\ No newline at end of file
@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 import streamlit as st
 
-from data.model import load_pages, slugify, JobBoard
+from data.model import load_pages_cached, slugify, JobBoard
 from ui.page_renderer import run_page  # imported so the generated stubs can import it
 
 
@@ -14,27 +14,34 @@ ADD_PAGE_SCRIPT = ROOT / "ui" / "page" / "add_job_board.py"
 SEEK_PAGE_SCRIPT = ROOT / "ui" / "page" / "job_seek.py"
 
 
-def _ensure_generated_page_scripts():
+def _ensure_generated_page_scripts(boards: list[tuple[Path, JobBoard]]):
     """
     For each JSON page, create a tiny script in page/generated/
     that calls ui.page_renderer.run_page(<slug>).
     """
     GEN_PAGES_DIR.mkdir(parents=True, exist_ok=True)
 
-    for i, (_, page) in enumerate(load_pages(PAGES_DIR), start=1):
+    for i, (_, page) in enumerate(boards, start=1):
         slug = slugify(page.title)
         script_path = GEN_PAGES_DIR / f"{slug}.py"
-        content = (
+        expected = (
             "from ui.page_renderer import run_page\n"
             f"run_page({slug!r})\n"
-        )
-        # Write only if missing or changed
-        if not script_path.exists() or script_path.read_text(encoding="utf-8") != content:
-            script_path.write_text(content, encoding="utf-8")
+        ).encode("utf-8")
+        # The stub is a pure function of the slug and this function is its
+        # only writer, so a size match means the content matches too — one
+        # stat per page instead of reading every stub back.
+        try:
+            if script_path.stat().st_size == len(expected):
+                continue
+        except OSError:
+            pass  # missing; write it below
+        script_path.write_bytes(expected)
 
 
 def get_active_pages() -> list[st.Page]:
-    _ensure_generated_page_scripts()
+    boards = load_pages_cached(PAGES_DIR)
+    _ensure_generated_page_scripts(boards)
 
     # First page (non-data): Add new page form
     pages: list[st.Page] = [
@@ -52,16 +59,14 @@ def get_active_pages() -> list[st.Page]:
         )
     ]
 
-    # Then one page per JSON config
-    for script in sorted(GEN_PAGES_DIR.glob("*.py")):
-        if script.suffix != ".py":
-            continue
-
-        slug = script.stem
-        page = JobBoard.from_file(PAGES_DIR / f"{slug}.json")
+    # Then one page per JSON config, in slug order (same order the old
+    # generated-directory glob produced) — no re-parsing of board files and
+    # no directory scan.
+    for _, page in sorted(boards, key=lambda it: slugify(it[1].title)):
+        slug = slugify(page.title)
         pages.append(
             st.Page(
-                str(script),
+                str(GEN_PAGES_DIR / f"{slug}.py"),
                 title=page.title,
                 icon=":material/work:",
                 url_path=slug
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 import streamlit as st
-from data.model import JobBoard, slugify, load_pages  # <- import load_pages
+from data.model import JobBoard, slugify, load_pages_cached
 from services.image.logo_preprocess import preprocess_logo
 
 PAGES_DIR = Path(__file__).resolve().parents[2] / "data" / "pages"
@@ -58,7 +58,7 @@ def render_add_page_form():
 
     # -------- Current job boards list --------
     st.subheader("Active job boards")
-    pages = load_pages(PAGES_DIR)
+    pages = load_pages_cached(PAGES_DIR)
 
     if not pages:
         st.info("No job boards yet.")
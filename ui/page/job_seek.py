@@ -1,11 +1,15 @@
+import os
+import time
+from dataclasses import dataclass
 from operator import itemgetter
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
 from datetime import datetime, timezone, timedelta
 from typing import Iterable, List, Tuple
-from data.model import load_pages, JobBoard, Job  # your helper
+from data.model import load_pages_cached, now_utc, JobBoard, Job  # your helper
 from pathlib import Path
 
 from services.image.logo_preprocess import preprocess_logo
@@ -14,10 +18,145 @@ from ui.cards.job import display_job
 PAGES_DIR = Path("data/pages")  # adjust if needed
 
 
+@dataclass(frozen=True)
+class _DashboardBundle:
+    pages: list[tuple[Path, JobBoard]]
+    all_jobs: list[Job]
+    # board title -> (starts, ends, job index, job count); see intervals_array
+    board_arrays: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, int]]
+    new_active: list[tuple[JobBoard, Job]]
+
+
+# Open intervals get their end stamped at bundle-build time, so the bundle
+# must also refresh when the clock crosses into a new chart bin even if no
+# file changed. Matches the 30min grid below.
+_BUNDLE_BIN_NS = 30 * 60 * 1_000_000_000
+
+
+def _pages_fingerprint() -> Tuple[int, int]:
+    """
+    Cheap change signal for the page files: newest mtime plus file count
+    (the count covers deletions). One scandir, no parsing.
+    """
+    latest = 0
+    count = 0
+    try:
+        with os.scandir(PAGES_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    count += 1
+                    mtime_ns = entry.stat().st_mtime_ns
+                    if mtime_ns > latest:
+                        latest = mtime_ns
+    except FileNotFoundError:
+        pass
+    return latest, count
+
+
+def _current_bundle() -> _DashboardBundle:
+    latest_mtime_ns, page_count = _pages_fingerprint()
+    return _load_bundle(latest_mtime_ns, page_count, time.time_ns() // _BUNDLE_BIN_NS)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _load_bundle(latest_mtime_ns: int, page_count: int, bin_idx: int) -> _DashboardBundle:
+    """
+    One shared pass over the page data for both 30-second fragments.
+    dashboard() and new_jobs_list() used to each load and walk every board;
+    cache_resource hands both the same bundle without pickling the boards
+    (which would defeat their instance-level interval caches). The key is a
+    fingerprint of the files plus the current chart bin, so idle ticks where
+    nothing on disk changed skip the walk entirely instead of riding a TTL.
+    """
+    pages = load_pages_cached(PAGES_DIR)
+    now = now_utc()  # one clock read shared by every freshness check
+    all_jobs: list[Job] = []
+    board_arrays: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, int]] = {}
+    new_active: list[tuple[JobBoard, Job]] = []
+    for _, board in pages:
+        starts, ends, job_ids = board.intervals_array()
+        board_arrays[board.title] = (starts, ends, job_ids, len(board.content))
+        all_jobs.extend(board.content)
+        for job in board.content:
+            if job.is_new(now=now) and job.is_active():
+                new_active.append((board, job))
+    return _DashboardBundle(pages, all_jobs, board_arrays, new_active)
+
+
+# --- helper to build a legend chart for a subset of categories ---
+def _make_legend_chart(names, n_cols, color_scale, step_x=140, step_y=28):
+    df = pd.DataFrame({"Job board": names})
+    df["idx"] = range(len(df))
+    df["col"] = df["idx"] % n_cols
+    df["row"] = df["idx"] // n_cols
+
+    x_pos = alt.X("col:O", axis=None, scale=alt.Scale(padding=0))
+    y_pos = alt.Y("row:O", axis=None, scale=alt.Scale(padding=0))
+
+    pts = (
+        alt.Chart(df)
+        .mark_square(size=110)
+        .encode(
+            x=x_pos,
+            y=y_pos,
+            color=alt.Color("Job board:N", scale=color_scale, legend=None),
+            tooltip=["Job board:N"],
+        )
+    )
+    lbl = (
+        alt.Chart(df)
+        .mark_text(align="left", dx=8, dy=1)
+        .encode(
+            x=x_pos,
+            y=y_pos,
+            text="Job board:N",
+            color=alt.Color("Job board:N", scale=color_scale, legend=None),
+        )
+    )
+    return (pts + lbl).properties(
+        width=alt.Step(step_x),
+        height=alt.Step(step_y),
+        padding=0
+    ).configure_view(stroke=None)
+
+
+@st.cache_resource(ttl=120, max_entries=4, show_spinner=False)
+def _build_charts(melted: pd.DataFrame):
+    """
+    Build the main area chart and the two legend panels. Altair serializes
+    the whole frame into the spec at construction time, so this is cached on
+    the melted data: a refresh whose counts didn't change reuses the specs.
+    cache_resource (not cache_data) returns the same chart objects — they are
+    never mutated after construction — and skips a pickle round-trip per hit.
+    """
+    # --- build two legend panels with the same color scale/domain ---
+    cats = sorted(melted["Job board"].unique().tolist())
+    color_scale = alt.Scale(domain=cats, scheme="tableau20")
+
+    half = (len(cats) + 1) // 2  # left gets the extra one if odd
+    legend_left = _make_legend_chart(cats[:half], n_cols=2, color_scale=color_scale)
+    legend_right = _make_legend_chart(cats[half:], n_cols=2, color_scale=color_scale)
+
+    # --- main chart (unchanged) ---
+    chart = (
+        alt.Chart(melted)
+        .mark_area()
+        .encode(
+            x=alt.X("time:T", title="Time (UTC)"),
+            y=alt.Y("count:Q", stack="zero", title="Active job postings"),
+            color=alt.Color("Job board:N", scale=color_scale, legend=None),
+            tooltip=[alt.Tooltip("time:T"), "Job board:N", "count:Q"],
+        )
+        .properties(height=500)
+        .interactive(bind_y=False)
+    )
+    return chart, legend_left, legend_right
+
+
 @st.fragment(run_every=30)
 def dashboard():
-    pages: list[tuple[Path, object]] = load_pages(PAGES_DIR)
-    if not pages:
+    bundle = _current_bundle()
+    if not bundle.pages:
         st.info("No active postings in the selected period.")
         return
 
@@ -28,60 +167,34 @@ def dashboard():
 
     now_utc = pd.Timestamp.now("UTC")
 
-    # Build active intervals per job from status history
-    def active_intervals(job) -> list[tuple[datetime, datetime]]:
-        hist = sorted(job.history, key=lambda s: s.at)
-        intervals: list[tuple[datetime, datetime]] = []
-        cur_start = None
-        for ev in hist:
-            if ev.status == "active":
-                if cur_start is None:
-                    cur_start = ev.at
-            else:  # inactive
-                if cur_start is not None:
-                    if ev.at > cur_start:
-                        intervals.append((cur_start, ev.at))
-                    cur_start = None
-        if cur_start is not None:
-            intervals.append((cur_start, now_utc))
-        return intervals
-
-    # Helper: active/new as-of a given time
-    def is_active_at(job, t: pd.Timestamp) -> bool:
-        t = ensure_utc(t)
-        for s, e in active_intervals(job):
-            if ensure_utc(s) <= t < ensure_utc(e):
-                return True
-        return False
-
-    def first_active_at(job) -> pd.Timestamp | None:
-        for ev in sorted(job.history, key=lambda s: s.at):
-            if ev.status == "active":
-                return ensure_utc(ev.at)
-        return None
-
-    # Collect intervals per board and determine global time span
-    board_intervals: dict[str, list[tuple[datetime, datetime]]] = {}
-    all_starts, all_ends = [], []
-    all_jobs = []
+    board_arrays = bundle.board_arrays
+    all_jobs = bundle.all_jobs
 
-    for _, board in pages:
-        intervals: list[tuple[datetime, datetime]] = []
-        for job in board.content:
-            all_jobs.append(job)
-            for s, e in active_intervals(job):
-                intervals.append((s, e))
-                all_starts.append(s)
-                all_ends.append(e)
-        board_intervals[board.title] = intervals
-
-    if not all_starts or not all_ends:
+    # Helper: per-job "active at t" mask across one board's intervals
+    def active_job_mask(
+        starts: np.ndarray, ends: np.ndarray, job_ids: np.ndarray, n_jobs: int,
+        t64: np.datetime64,
+    ) -> np.ndarray:
+        mask = np.zeros(n_jobs, dtype=bool)
+        hit = (starts <= t64) & (t64 < ends)
+        mask[job_ids[hit]] = True
+        return mask
+
+    if not any(s.size for s, _, _, _ in board_arrays.values()):
         st.info("No active postings in the selected period.")
         return
 
-    start_ts = ensure_utc(min(all_starts))
-    end_ts = ensure_utc(max(max(all_ends), now_utc))
-    freq = "30min"
+    start_ts = ensure_utc(
+        pd.Timestamp(min(s.min() for s, _, _, _ in board_arrays.values() if s.size))
+    )
+    end_ts = max(
+        ensure_utc(pd.Timestamp(max(e.max() for _, e, _, _ in board_arrays.values() if e.size))),
+        now_utc,
+    )
+    # Chart resolution is capped by pixel width anyway, so coarsen the bin
+    # as the observed span grows: 30min floor, at most ~1000 grid rows.
+    span = end_ts - start_ts
+    freq = max(pd.Timedelta(minutes=30), span / 1000)
 
     # Note: start/end are tz-aware UTC; don't pass tz=...
     times = pd.date_range(start=start_ts, end=end_ts, freq=freq)
@@ -89,103 +202,43 @@ def dashboard():
         st.info("No active postings in the selected period.")
         return
 
-    df = pd.DataFrame(index=times)
-
-    # Build step count series per board using ONLY +1/-1 deltas (no baseline seeding)
-    for board_title, intervals in board_intervals.items():
-        if not intervals:
-            df[board_title] = 0
+    # Build step counts from ONLY +1/-1 deltas (no baseline seeding), as a
+    # difference array over the grid: +1 at the first grid tick an interval
+    # covers, -1 at the first tick past it, then one cumsum per column. A
+    # grid tick t counts an interval iff start <= t < end, matching the old
+    # event-series semantics without any per-event pandas work.
+    # (Degenerate intervals are already filtered out.)
+    titles = list(board_arrays)
+    times64 = times.tz_localize(None).values  # datetime64[ns] UTC grid
+    counts = np.zeros((len(times) + 1, len(titles)), dtype=np.int32)
+    for col, board_title in enumerate(titles):
+        starts, ends, _jids, _n = board_arrays[board_title]
+        if starts.size == 0:
             continue
-
-        events: dict[pd.Timestamp, int] = {}
-        for s, e in intervals:
-            s_ts = ensure_utc(s)
-            e_ts = ensure_utc(e)
-            if e_ts <= s_ts:
-                continue
-            events[s_ts] = events.get(s_ts, 0) + 1
-            events[e_ts] = events.get(e_ts, 0) - 1
-
-        if not events:
-            df[board_title] = 0
-            continue
-
-        ev_series = pd.Series(events).sort_index().cumsum()
-        counts = ev_series.reindex(times, method="ffill").fillna(0).astype(int)
-        df[board_title] = counts.values
-
-    # All zeros?
-    if df.to_numpy().sum() == 0:
+        s_idx = times64.searchsorted(starts, side="left")
+        e_idx = times64.searchsorted(ends, side="left")
+        np.add.at(counts[:, col], s_idx, 1)
+        np.add.at(counts[:, col], e_idx, -1)
+    counts = np.cumsum(counts[:-1], axis=0)
+
+    # All zeros? Decided on the counts array itself, before spending a
+    # DataFrame build (and a to_numpy() copy) on an empty grid.
+    if not counts.any():
         st.info("No active postings in the selected period.")
         return
 
-    # Melt and rename to "Job board"
-    melted = (
-        df.reset_index()
-          .rename(columns={"index": "time"})
-          .melt(id_vars="time", var_name="Job board", value_name="count")
+    # Long form for Altair, built straight from the counts matrix instead of
+    # a wide frame + melt (melt runs a per-column concat pipeline). Column
+    # order matches what melt produced: board 0 for all times, then board 1.
+    melted = pd.DataFrame(
+        {
+            "time": pd.DatetimeIndex(np.tile(times64, len(titles))).tz_localize("UTC"),
+            "Job board": np.repeat(np.array(titles, dtype=object), len(times)),
+            "count": counts.T.ravel(),
+        }
     )
 
-    # --- helper to build a legend chart for a subset of categories ---
-    def make_legend_chart(names, n_cols, color_scale, step_x=140, step_y=28):
-        df = pd.DataFrame({"Job board": names})
-        df["idx"] = range(len(df))
-        df["col"] = df["idx"] % n_cols
-        df["row"] = df["idx"] // n_cols
-
-        x_pos = alt.X("col:O", axis=None, scale=alt.Scale(padding=0))
-        y_pos = alt.Y("row:O", axis=None, scale=alt.Scale(padding=0))
-
-        pts = (
-            alt.Chart(df)
-            .mark_square(size=110)
-            .encode(
-                x=x_pos,
-                y=y_pos,
-                color=alt.Color("Job board:N", scale=color_scale, legend=None),
-                tooltip=["Job board:N"],
-            )
-        )
-        lbl = (
-            alt.Chart(df)
-            .mark_text(align="left", dx=8, dy=1)
-            .encode(
-                x=x_pos,
-                y=y_pos,
-                text="Job board:N",
-                color=alt.Color("Job board:N", scale=color_scale, legend=None),
-            )
-        )
-        return (pts + lbl).properties(
-            width=alt.Step(step_x),
-            height=alt.Step(step_y),
-            padding=0
-        ).configure_view(stroke=None)
-
-    # --- build two legend panels with the same color scale/domain ---
-    cats = sorted(melted["Job board"].unique().tolist())
-    color_scale = alt.Scale(domain=cats, scheme="tableau20")
-
-    half = (len(cats) + 1) // 2  # left gets the extra one if odd
-    left_cats = cats[:half]
-    right_cats = cats[half:]
-
-    legend_left = make_legend_chart(left_cats, n_cols=2, color_scale=color_scale)
-    legend_right = make_legend_chart(right_cats, n_cols=2, color_scale=color_scale)
-
-    # --- main chart (unchanged) ---
-    chart = (
-        alt.Chart(melted)
-        .mark_area()
-        .encode(
-            x=alt.X("time:T", title="Time (UTC)"),
-            y=alt.Y("count:Q", stack="zero", title="Active job postings"),
-            color=alt.Color("Job board:N", scale=color_scale, legend=None),
-            tooltip=[alt.Tooltip("time:T"), "Job board:N", "count:Q"],
-        )
-        .properties(height=500)
-        .interactive(bind_y=False)
-    )
+    chart, legend_left, legend_right = _build_charts(melted)
 
     with st.container(border=True, key="dashboard-holder"):
         st.altair_chart(chart, use_container_width=True, key="job-board-chart")
@@ -197,25 +250,40 @@ def dashboard():
 
         # ── Metrics: current counts and Δ vs 24h ago ─────────────────────────────
         t_24 = now_utc - pd.Timedelta(hours=24)
+        t24_64 = t_24.tz_convert("UTC").tz_localize(None).to_datetime64()
         threshold = timedelta(hours=48)
 
         # Active now / 24h ago
         active_now = sum(1 for j in all_jobs if j.is_active())
-        active_24h_ago = sum(1 for j in all_jobs if is_active_at(j, t_24))
+        active_24h_ago = sum(
+            int(active_job_mask(s, e, j, n, t24_64).sum())
+            for s, e, j, n in board_arrays.values()
+        )
         active_delta = active_now - active_24h_ago
 
-        # New (≤24h) now / 24h ago (and active at that time)
-        def is_new_as_of(j, t: pd.Timestamp, thr: timedelta = threshold) -> bool:
-            fa = first_active_at(j)
-            return (
-                fa is not None
-                and t >= fa
-                and (t - fa) <= thr
-                and is_active_at(j, t)
+        # New (≤threshold) as-of t: first activation within the window AND
+        # active at t. First activation per job is the min interval start.
+        _NO_START = np.iinfo(np.int64).max
+        t24_ns = t24_64.astype("datetime64[ns]").astype(np.int64)
+        thr_ns = int(threshold.total_seconds() * 1_000_000_000)
+
+        def new_count_at(
+            starts: np.ndarray, ends: np.ndarray, job_ids: np.ndarray, n_jobs: int,
+        ) -> int:
+            if starts.size == 0:
+                return 0
+            fa = np.full(n_jobs, _NO_START, dtype=np.int64)
+            np.minimum.at(fa, job_ids, starts.astype(np.int64))
+            new_mask = (
+                (fa != _NO_START)
+                & (fa <= t24_ns)
+                & (t24_ns - fa <= thr_ns)
+                & active_job_mask(starts, ends, job_ids, n_jobs, t24_64)
             )
+            return int(new_mask.sum())
 
         new_now = sum(1 for j in all_jobs if j.is_active() and j.is_new())  # uses Job.is_new() default (24h)
-        new_24h_ago = sum(1 for j in all_jobs if is_new_as_of(j, t_24))
+        new_24h_ago = sum(new_count_at(s, e, j, n) for s, e, j, n in board_arrays.values())
         new_delta = new_now - new_24h_ago
 
         with st.container(horizontal=True, horizontal_alignment="left", key="metrics-container", gap="medium"):
@@ -225,13 +293,10 @@ def dashboard():
 
 @st.fragment(run_every=30)
 def new_jobs_list():
-    all_jobs: List[Tuple[JobBoard, Job]] = []
-    for path, job_board in load_pages(PAGES_DIR):
-        for idx, job in enumerate(job_board.content):
-            if job.is_new() and job.is_active():
-                all_jobs.append((job_board, job))
-
-    all_jobs = sorted(all_jobs, key=lambda j: j[1].age())
+    # sorted() evaluates the key once per element; passing one shared `now`
+    # removes the remaining per-job clock read.
+    now = now_utc()
+    all_jobs = sorted(_current_bundle().new_active, key=lambda j: j[1].age(now))
 
     with st.container(border=True, key="new-jobs-holder"):
         for job_idx, (job_board, job) in enumerate(all_jobs):
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from pathlib import Path
+
+import numpy as np
 import streamlit as st
-from data.model import load_pages, slugify, JobBoard
+from data.model import JobBoard, _json_loads, now_utc
 from services.image.logo_preprocess import preprocess_logo
 from ui.cards.job import display_job
 
@@ -12,11 +14,10 @@ PAGES_DIR = Path(__file__).resolve().parents[1] / "data" / "pages"
 def run_page(slug: str):
     st.set_page_config(page_title="Job Seek", layout="centered")
 
-    # Find the page by slug (derived from its title)
-    for _, page in load_pages(PAGES_DIR):
-        if slugify(page.title) == slug:
-            _render_page(slug)
-            break
+    # Board files are written as <slugify(title)>.json, so resolving a slug
+    # is one existence check — no need to load and slugify every board.
+    if (PAGES_DIR / f"{slug}.json").is_file():
+        _render_page(slug)
     else:
         st.error(f"JobBoard not found for slug '{slug}'.")
         st.stop()
@@ -30,10 +31,55 @@ def _refresh(slug: str):
     jb.to_file(path)
 
 
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _load_board(path_str: str, mtime_ns: int) -> JobBoard:
+    """
+    Parse a board file, keyed on (path, mtime). The 5-second fragment mostly
+    sees an unchanged file; only a rewrite (scrape or _refresh) changes the
+    mtime and forces a re-parse. Parses directly rather than via from_file,
+    whose 30s TTL cache could hand a pre-rewrite board to a new mtime key.
+    """
+    return JobBoard(**_json_loads(Path(path_str).read_bytes()))
+
+
+def _render_refresh_bar(slug: str, page: JobBoard, *, key_suffix: str = ""):
+    """Freshness notice plus the manual-refresh button (shared by the
+    populated and empty board layouts)."""
+    with st.container(
+        key=f"refresh-{slug}{key_suffix}",
+        horizontal=True,
+        horizontal_alignment="right",
+        vertical_alignment="center"
+    ):
+        if page.last_scraped:
+            # Bucket the age coarser than the 5s fragment tick (a 0.1-min
+            # bucket would change on nearly every rerun): past the first
+            # minute, whole minutes. While the bucket holds, the string is
+            # byte-identical and Streamlit's element diffing turns the tick
+            # into a frontend no-op. total_seconds, not .seconds — the
+            # latter wraps at 24h.
+            mins = (
+                datetime.now(tz=page.last_scraped.tzinfo) - page.last_scraped
+            ).total_seconds() / 60
+            label = f"{mins:.1f}" if mins < 1 else f"{mins:.0f}"
+            st.info(f"Last updated {label} minutes ago.")
+        else:
+            st.warning("Scraping is in progress...")
+
+        st.button(
+            ":material/refresh:",
+            key=f"refresh-btn-{slug}",
+            type="primary",
+            help="Refresh the job listings",
+            on_click=_refresh,
+            args=(slug,)
+        )
+
+
 @st.fragment(run_every=5)
 def _render_page(slug: str):
     path = PAGES_DIR / f"{slug}.json"
-    page = JobBoard.from_file(path)
+    page = _load_board(str(path), path.stat().st_mtime_ns)
 
     # Header with icon + title
     with st.container(
@@ -56,29 +102,7 @@ def _render_page(slug: str):
         st.link_button("To Job Board", url)
 
     if page.content:
-        with st.container(
-            key=f"refresh-{slug}",
-            horizontal=True,
-            horizontal_alignment="right",
-            vertical_alignment="center"
-        ):
-            if page.last_scraped:
-                st.info(
-                    f"Last updated "
-                    f"{(datetime.now(tz=page.last_scraped.tzinfo) - page.last_scraped).seconds / 60:.1f} "
-                    f"minutes ago."
-                )
-            else:
-                st.warning("Scraping is in progress...")
-
-            st.button(
-                ":material/refresh:",
-                key=f"refresh-btn-{slug}",
-                type="primary",
-                help="Refresh the job listings",
-                on_click=_refresh,
-                args=(slug,)
-            )
+        _render_refresh_bar(slug, page)
 
         with st.container(key=f"list-{slug}", border=True):
             filter_criteria = st.pills(
@@ -90,40 +114,37 @@ def _render_page(slug: str):
             )
 
             # Sort: active jobs first; among active, least age() first.
-            sorted_jobs = sorted(
-                page.content,
-                key=lambda j: (not j.is_active(), j.age() if j.is_active() else float("inf"))
+            # Keys are evaluated once per job into arrays and ordered with
+            # one lexsort (primary: inactive last, secondary: age).
+            n = len(page.content)
+            now = now_utc()
+            active = np.fromiter((j.is_active() for j in page.content), dtype=bool, count=n)
+            age_s = np.fromiter(
+                (
+                    j.age(now).total_seconds() if is_act else np.inf
+                    for j, is_act in zip(page.content, active)
+                ),
+                dtype=np.float64,
+                count=n,
             )
+            order = np.lexsort((age_s, ~active))
+            sorted_jobs = [page.content[i] for i in order]
+
+            # Filter with the cheapest disqualifier first: the pill lookups
+            # are hoisted out of the loop and the activity flag comes from
+            # the array computed above, so filtered-out jobs cost no extra
+            # method calls.
+            want_active = "active" in filter_criteria
+            want_new = "new" in filter_criteria
+            active_sorted = active[order]
 
             for job_idx, job in enumerate(sorted_jobs):
-                if "new" in filter_criteria and not job.is_new():
+                if want_active and not active_sorted[job_idx]:
                     continue
-                if "active" in filter_criteria and not job.is_active():
+                if want_new and not job.is_new(now=now):
                     continue
 
                 job_id = f"job-{slug}-{job_idx}"
                 display_job(job_id, job)
     else:
-        with st.container(
-                key=f"refresh-{slug}-empty",
-                horizontal=True,
-                horizontal_alignment="right",
-                vertical_alignment="center"
-        ):
-            if page.last_scraped:
-                st.info(
-                    f"Last updated "
-                    f"{(datetime.now(tz=page.last_scraped.tzinfo) - page.last_scraped).seconds / 60:.1f} "
-                    f"minutes ago."
-                )
-            else:
-                st.warning("Scraping is in progress...")
-
-            st.button(
-                ":material/refresh:",
-                key=f"refresh-btn-{slug}",
-                type="primary",
-                help="Refresh the job listings",
-                on_click=_refresh,
-                args=(slug,)
-            )
+        _render_refresh_bar(slug, page, key_suffix="-empty")